@@ -8,8 +8,10 @@ Complete implementation with all patterns
 import os
 import re
 import sys
+import stat
 import json
 import gzip
+import pickle
 import time
 import mmap
 import bisect
@@ -18,28 +20,48 @@ import tarfile
 import tempfile
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any, Iterator, NamedTuple, Union
+from typing import Dict, List, Set, Tuple, Optional, Any, Iterable, Iterator, NamedTuple, Union
 from collections import defaultdict, Counter, deque
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field, asdict
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from functools import lru_cache
+from itertools import count, islice
+from enum import IntEnum
 import multiprocessing as mp
 from queue import Queue, Empty
 import threading
 import heapq
 import asyncio
+from array import array
 from asyncio import Queue as AsyncQueue
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
 # Try to import optional performance libraries
 try:
-    import pyahocorasick
+    import ahocorasick as pyahocorasick  # PyPI package "pyahocorasick" installs as `ahocorasick`
     HAS_AHOCORASICK = True
 except ImportError:
     HAS_AHOCORASICK = False
     if __name__ == "__main__":
         print("⚠️  Install pyahocorasick for 10x faster pattern matching: pip install pyahocorasick")
 
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+try:
+    import re2 as google_re2  # PyPI package "google-re2": linear-time, no lookarounds
+    HAS_GOOGLE_RE2 = True
+except ImportError:
+    HAS_GOOGLE_RE2 = False
+
 try:
     import regex as re2
     HAS_REGEX = True
@@ -53,10 +75,335 @@ try:
 except ImportError:
     HAS_FUZZY = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from isal import igzip  # PyPI package "isal": ISA-L backed drop-in for gzip
+    HAS_ISAL = True
+except ImportError:
+    HAS_ISAL = False
+
+# Severity tokens that open many patterns (e.g. r'FATAL:.*praefect'). Patterns are
+# case-insensitive, so a pattern starting with one of these can only match lines
+# whose lowercased text contains the token.
+SEVERITY_PREFIXES = ('fatal', 'panic', 'error', 'warning', 'log')
+LEADING_WORD_RE = re.compile(r'(?:\(\?:(?P<alt1>\w+)\|(?P<alt2>\w+)\)|(?P<word>\w+))(?![?*+{])')
+
+# Message normalization shared by the per-match and per-group signatures
+TIMESTAMP_RE = re.compile(r'\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}')
+UUID_RE = re.compile(r'[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}')
+NUMBER_RE = re.compile(r'\b\d+\b')
+
+# Message extractors for _extract_clean_message: component/pattern-specific ones
+# apply when their key is in the pattern id or component, generic ones after them
+MESSAGE_EXTRACTORS = tuple((key, re.compile(regex, re.IGNORECASE)) for key, regex in (
+    ('ssl', r'(?:error|failed):\s*(.+?)(?:\n|$)'),
+    ('timeout', r'timeout.*?:\s*(.+?)(?:\n|$)'),
+    ('connection', r'connection.*?:\s*(.+?)(?:\n|$)'),
+    ('postgres', r'ERROR:\s*(.+?)(?:\n|$)'),
+    ('grpc', r'desc\s*=\s*"?([^"]+)"?'),
+    ('redis', r'(?:Redis|REDIS).*?:\s*(.+?)(?:\n|$)'),
+    ('sidekiq', r'(?:failed|error):\s*(.+?)(?:\n|$)'),
+))
+GENERIC_MESSAGE_EXTRACTORS = tuple(re.compile(regex, re.IGNORECASE) for regex in (
+    r'(?:ERROR|FATAL|CRITICAL|error|fail)[:\s]+(.+?)(?:\n|$)',
+    r'message[:\s]+["\']*([^"\']+)',
+    r'msg[:\s]+["\']*([^"\']+)',
+))
+
+# Metadata pulled from an error line by _extract_metadata, and from its context lines
+METADATA_EXTRACTORS = tuple((field_name, re.compile(regex, re.IGNORECASE)) for field_name, regex in (
+    ('correlation_id', r'correlation_id[=:]\s*"?([a-zA-Z0-9\-_]+)"?'),
+    ('request_id', r'request_id[=:]\s*"?([a-zA-Z0-9\-_]+)"?'),
+    ('status_code', r'\b([45]\d{2})\s+(?:Error|Bad|Not)'),
+    ('grpc_code', r'code\s*=\s*(\w+)'),
+))
+CONTEXT_CORRELATION_RE = re.compile(r'correlation_id[=:]\s*"?([a-zA-Z0-9\-_]+)"?')
+CONTEXT_STATUS_RE = re.compile(r'\b([45]\d{2})\s+')
+
+# Timestamp formats tried in order by _extract_timestamp (first one that parses wins,
+# so they stay separate rather than one leftmost-match alternation)
+TIMESTAMP_EXTRACTORS = tuple(re.compile(regex) for regex in (
+    r'(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2})',
+    r'"time":"([^"]+)"',
+    r'"timestamp":"([^"]+)"',
+    r'"@timestamp":"([^"]+)"',
+    r'\[(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[^\]]*)\]',
+))
+
+# JSON log lines are parsed with orjson when available (several times faster);
+# its JSONDecodeError subclasses json's, so the existing handlers still apply
+json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Rotated .gz logs and .tar.gz bundles are decompressed with ISA-L when available
+# (several times faster inflate); same open() signature as gzip's
+gzip_open = igzip.open if HAS_ISAL else gzip.open
+
+# Atomic groups `(?>...)` need the `regex` module or Python 3.11+ `re`
+HAS_ATOMIC_GROUPS = HAS_REGEX or sys.version_info >= (3, 11)
+
+# `__slots__` dataclasses need Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Shortest literal worth using as a trigger word; shorter ones hit nearly every line
+MIN_TRIGGER_LENGTH = 3
+
+# Hyperscan replaces the Aho-Corasick routing when installed; AUTOGREP_HYPERSCAN=0
+# forces the automaton (e.g. to rule out a prefilter miss when debugging)
+USE_HYPERSCAN = HAS_HYPERSCAN and os.environ.get('AUTOGREP_HYPERSCAN') != '0'
+
+# Lines at least this long are matched with RE2 where the pattern allows it:
+# backtracking through several `.*` gaps grows polynomially with line length
+# (a 100KB JSON line took 40s across the bank), while RE2 stays linear. On
+# short lines the per-call overhead of the RE2 binding makes it the slower one.
+LINEAR_MATCH_MIN_CHARS = 512
+
+# Where prebuilt matcher artifacts (automaton, Hyperscan databases) are cached between runs
+CACHE_DIR = Path(os.environ.get('AUTOGREP_CACHE_DIR', Path.home() / '.cache' / 'autogrep'))
+
+# Hyperscan databases run as prefilters: PREFILTER lets Hyperscan accept what it
+# can't match exactly (lookarounds) by over-approximating, and the Python regexes
+# confirm every candidate. DOTALL only widens that: in UTF8 mode a bare `.` skips
+# some valid code points (e.g. U+9F1AA) that Python's `.` matches.
+HYPERSCAN_PREFILTER_FLAGS = (
+    hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP |
+    hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY |
+    hyperscan.HS_FLAG_DOTALL
+) if HAS_HYPERSCAN else 0
+
+
+def _load_cache_file(cache_file: Path, name: str, loads) -> Any:
+    """Load an artifact built by a previous run (None on a miss)"""
+    try:
+        with open(cache_file, 'rb') as f:
+            return loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️  Ignoring unreadable {name} cache {cache_file}: {e}")
+        return None
+
+
+def _store_cache_file(cache_file: Path, name: str, data: bytes):
+    """Write via a temp file so concurrent workers never read a partial cache"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"⚠️  Could not cache {name}: {e}")
+
+
+def _load_hyperscan_db(data: bytes) -> 'hyperscan.Database':
+    """Deserialize a database; it comes without the scratch space scan() needs"""
+    database = hyperscan.loadb(data, hyperscan.HS_MODE_BLOCK)
+    database.scratch = hyperscan.Scratch(database)
+    return database
+
 
-@dataclass(frozen=True)
+def _compile_hyperscan_db(expressions: List[bytes]) -> 'hyperscan.Database':
+    """Compile regexes into one block-mode prefilter database; match ids are list indexes"""
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(expressions=expressions, ids=list(range(len(expressions))),
+                     elements=len(expressions), flags=[HYPERSCAN_PREFILTER_FLAGS] * len(expressions))
+    return database
+
+
+@lru_cache(maxsize=None)
+def _false_positive_db(expressions: Tuple[str, ...]) -> Optional['hyperscan.Database']:
+    """Hyperscan prefilter over the false-positive filter's regexes, built once per process"""
+    # Forked workers inherit the parent's database; spawned ones load it from disk
+    digest = hashlib.sha256(repr((HYPERSCAN_PREFILTER_FLAGS, expressions)).encode()).hexdigest()[:16]
+    cache_file = CACHE_DIR / f"false_positive_{digest}.db"
+    database = _load_cache_file(cache_file, 'false positive', _load_hyperscan_db)
+    if database is not None:
+        return database
+    
+    try:
+        database = _compile_hyperscan_db([expression.encode() for expression in expressions])
+    except Exception as e:
+        print(f"⚠️  Hyperscan rejected the false positive patterns, using the regular filter: {e}")
+        return None
+    print(f"✅ Built Hyperscan false positive database with {len(expressions)} patterns")
+    _store_cache_file(cache_file, 'false positive', hyperscan.dumpb(database))
+    return database
+
+
+def _required_literal_runs(items) -> List[str]:
+    """Contiguous literal runs (lowercased) that every match of a parsed sequence contains"""
+    runs: List[str] = []
+    current: List[str] = []
+    
+    def flush():
+        if current:
+            runs.append(''.join(current))
+            current.clear()
+    
+    def walk(seq):
+        for op, arg in seq:
+            if op is sre_parse.LITERAL:
+                current.append(chr(arg).lower())
+            elif op is sre_parse.SUBPATTERN:
+                walk(arg[-1])  # Groups are still part of the sequence
+            elif op in (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+                continue  # Zero-width, doesn't break contiguity
+            elif op is sre_parse.BRANCH:
+                # (?:ERROR|error) style alternations that only differ in case
+                alts = [''.join(chr(a).lower() for o, a in alt) if all(o is sre_parse.LITERAL for o, _ in alt) else None
+                        for alt in arg[1]]
+                if alts[0] and all(a == alts[0] for a in alts):
+                    current.extend(alts[0])
+                else:
+                    flush()
+            elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and arg[0] >= 1:
+                flush()
+                walk(arg[2])  # Body occurs at least once
+                flush()
+            else:
+                flush()
+    
+    walk(items)
+    flush()
+    return runs
+
+
+def extract_literal_runs(regex_pattern: str) -> List[List[str]]:
+    """Required literal runs (lowercased) of each top-level alternative; [] if unparseable"""
+    try:
+        items = list(sre_parse.parse(regex_pattern))
+    except Exception:
+        return []
+    
+    if len(items) == 1 and items[0][0] is sre_parse.BRANCH:
+        alternatives = items[0][1][1]
+    else:
+        alternatives = [items]
+    
+    return [_required_literal_runs(alternative) for alternative in alternatives]
+
+
+def trigger_words_from_runs(runs: List[List[str]]) -> frozenset:
+    """
+    Return one required literal per top-level alternative, or an empty set if
+    some alternative has no literal of MIN_TRIGGER_LENGTH chars. A line can
+    only match the pattern if it contains one of the trigger words.
+    """
+    triggers = set()
+    for alternative_runs in runs:
+        best = max(alternative_runs, key=len, default='')
+        if len(best) < MIN_TRIGGER_LENGTH:
+            return frozenset()
+        triggers.add(best)
+    
+    return frozenset(triggers)
+
+
+def extract_trigger_words(regex_pattern: str) -> frozenset:
+    """Trigger words of a regex (see trigger_words_from_runs)"""
+    return trigger_words_from_runs(extract_literal_runs(regex_pattern))
+
+
+def atomic_before_lookaheads(regex_pattern: str) -> str:
+    """
+    Rewrite `P(?!.*X)` as `(?>P)(?!.*X)` in each top-level alternative.
+    
+    When the lookahead fails, plain `P` backtracks through every shorter match
+    (each `error` in `Workhorse.*error(?!.*INFO)`) and rescans the rest of the
+    line each time - quadratic on long lines. The atomic group stops after the
+    first attempt. That is equivalent as long as P's first match is also its
+    longest (greedy `A.*B` shapes): a lookahead for "X somewhere after" that
+    fails at the longest match fails at every shorter one too.
+    """
+    if not HAS_ATOMIC_GROUPS or '(?!' not in regex_pattern:
+        return regex_pattern
+    
+    # Split into top-level alternatives, recording each one's top-level groups
+    alternatives = []  # (start, end, [(group_start, group_end), ...])
+    groups: List[Tuple[int, int]] = []
+    start = depth = 0
+    group_start = 0
+    in_class = False
+    i = 0
+    while i < len(regex_pattern):
+        char = regex_pattern[i]
+        if char == '\\':
+            i += 2
+            continue
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            if depth == 0:
+                group_start = i
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                groups.append((group_start, i + 1))
+        elif char == '|' and depth == 0:
+            alternatives.append((start, i, groups))
+            start, groups = i + 1, []
+        i += 1
+    alternatives.append((start, len(regex_pattern), groups))
+    
+    rewritten = []
+    for start, end, groups in alternatives:
+        body_end = end
+        for group_start, group_end in reversed(groups):
+            if group_end != body_end or not regex_pattern.startswith('(?!', group_start):
+                break
+            body_end = group_start
+        
+        body, tail = regex_pattern[start:body_end], regex_pattern[body_end:end]
+        if tail and body and any(q in body for q in '*+'):
+            rewritten.append(f"(?>{body}){tail}")
+        else:
+            rewritten.append(regex_pattern[start:end])
+    
+    return '|'.join(rewritten)
+
+
+class Severity(IntEnum):
+    """Severity ranks - compare/sort as small ints instead of strings"""
+    INFO = 0
+    WARNING = 1
+    ERROR = 2
+    CRITICAL = 3
+
+
+@lru_cache(maxsize=16384)
+def _normalize_message(message: str) -> str:
+    """Mask timestamps, UUIDs and numbers; repeated messages hit the cache"""
+    normalized = TIMESTAMP_RE.sub('TIMESTAMP', message)
+    normalized = UUID_RE.sub('UUID', normalized)
+    return NUMBER_RE.sub('N', normalized)
+
+
+@lru_cache(maxsize=1)
+def _linear_options() -> 'google_re2.Options':
+    """Case-insensitive RE2 options; unsupported syntax is expected, so not logged"""
+    options = google_re2.Options()
+    options.case_sensitive = False
+    options.log_errors = False
+    return options
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ErrorPattern:
-    """Immutable error pattern definition"""
+    """Immutable error pattern definition (slotted - no per-instance __dict__)"""
     id: str
     pattern: str
     component: str
@@ -66,14 +413,42 @@ class ErrorPattern:
     multiline: bool = False
     correlation_extractors: List[str] = field(default_factory=list)
     priority: int = 5  # 1-10, higher = more important
+    severity_rank: Severity = field(init=False, repr=False, compare=False)
+    compiled: Optional[Any] = field(init=False, repr=False, compare=False)  # None if the regex is invalid
+    linear: Optional[Any] = field(init=False, default=None, repr=False, compare=False)  # RE2 twin for long lines; None without google-re2 or for lookarounds
+    trigger_words: frozenset = field(init=False, default=frozenset(), repr=False, compare=False)  # Set by the bank; empty if no literal is required
+    
+    def __post_init__(self):
+        # A few hundred patterns share a handful of components and severities;
+        # interned, every match dict and group refers to the same objects
+        for name in ('id', 'component', 'category', 'severity'):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+        object.__setattr__(self, 'severity_rank', Severity[self.severity])
+        # Compile once here so no call site goes through re's compile cache.
+        # Trailing negative lookaheads get an atomic prefix (see
+        # atomic_before_lookaheads); `pattern` keeps the readable source.
+        # Files are split into lines once and every pattern runs against a
+        # single line, so MULTILINE buys nothing; `multiline=True` patterns get
+        # their surrounding event from LogBoundaryDetector instead.
+        try:
+            compiled = re2.compile(atomic_before_lookaheads(self.pattern), re2.IGNORECASE)
+        except Exception as e:
+            print(f"Failed to compile pattern {self.id}: {e}")
+            compiled = None
+        object.__setattr__(self, 'compiled', compiled)
+        if HAS_GOOGLE_RE2 and compiled is not None:
+            try:
+                object.__setattr__(self, 'linear', google_re2.compile(self.pattern, _linear_options()))
+            except google_re2.error:
+                pass  # Lookarounds/backreferences - RE2 can't express them
     
     def __hash__(self):
         return hash((self.id, self.pattern))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnhancedErrorMatch:
-    """Complete error match with ALL context preserved"""
+    """Complete error match with ALL context preserved (slotted - one per match)"""
     pattern: ErrorPattern
     matched_text: str
     clean_message: str  # The extracted, clean error message
@@ -98,6 +473,7 @@ class EnhancedErrorMatch:
     
     # Enhanced metadata
     error_code: Optional[str] = None  # HTTP status, GRPC code, etc
+    grpc_code: Optional[str] = None  # From "code=..." in plain-text lines
     stack_trace: Optional[List[str]] = None  # Full parsed stack trace
     json_fields: Dict[str, Any] = field(default_factory=dict)  # All JSON fields if applicable
     
@@ -112,12 +488,13 @@ class EnhancedErrorMatch:
     
     def _generate_signature(self) -> str:
         """Generate unique signature for error clustering"""
-        clean_text = re.sub(r'\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}', '', self.clean_message or self.matched_text)
-        clean_text = re.sub(r'[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}', 'UUID', clean_text)
-        clean_text = re.sub(r'\b\d+\b', 'N', clean_text)
+        clean_text = TIMESTAMP_RE.sub('', self.clean_message or self.matched_text)
+        clean_text = UUID_RE.sub('UUID', clean_text)
+        clean_text = NUMBER_RE.sub('N', clean_text)
         
         sig_input = f"{self.pattern.component}:{self.pattern.id}:{clean_text[:100]}"
-        return hashlib.md5(sig_input.encode()).hexdigest()[:16]
+        # Not a security hash: an 8-byte BLAKE2b digest is twice as fast as MD5
+        return hashlib.blake2b(sig_input.encode(), digest_size=8).hexdigest()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -188,10 +565,10 @@ class LogBoundaryDetector:
             r'^[A-Z][a-z]+.*:$',  # New section header
         ]
         
-        # Compile patterns
-        self.compiled_start = [(re.compile(p, re.MULTILINE), t) for p, t in self.error_start_patterns]
-        self.compiled_continuation = [re.compile(p, re.MULTILINE) for p in self.continuation_patterns]
-        self.compiled_end = [re.compile(p, re.MULTILINE) for p in self.end_patterns]
+        # Compile each kind into one alternation, so classifying a line is a single match()
+        self.start_match = re.compile('|'.join(f'(?:{p})' for p, _ in self.error_start_patterns), re.MULTILINE).match
+        self.continuation_match = re.compile('|'.join(f'(?:{p})' for p in self.continuation_patterns), re.MULTILINE).match
+        self.end_match = re.compile('|'.join(f'(?:{p})' for p in self.end_patterns), re.MULTILINE).match
     
     def detect_format(self, line: str) -> str:
         """Detect log format from line"""
@@ -214,62 +591,46 @@ class LogBoundaryDetector:
         end = match_line
         format_type = self.detect_format(lines[match_line] if match_line < len(lines) else '')
         
+        start_match = self.start_match
+        continuation_match = self.continuation_match
+        
         # Find start by going backwards
         for i in range(match_line - 1, max(0, match_line - 100), -1):
             line = lines[i]
             
-            # Check if this is a new log entry
-            is_new_entry = False
-            for pattern, _ in self.compiled_start:
-                if pattern.match(line):
-                    is_new_entry = True
-                    break
-            
-            if is_new_entry:
+            if start_match(line):
                 # This is a different log entry, stop here
                 break
             
-            # Check if this is continuation of current error
-            is_continuation = False
-            for pattern in self.compiled_continuation:
-                if pattern.match(line):
-                    is_continuation = True
-                    start = i
-                    break
-            
-            if not is_continuation and line.strip():
+            if continuation_match(line):
+                # Continuation of current error
+                start = i
+            elif line.strip():
                 # Not a continuation and not empty, stop
                 break
-            elif not line.strip():
+            elif i > 0 and continuation_match(lines[i-1]):
                 # Empty line might be part of stack trace
-                if i > 0 and any(p.match(lines[i-1]) for p in self.compiled_continuation):
-                    start = i
+                start = i
         
         # Find end by going forward
         in_stack = False
         for i in range(match_line + 1, min(len(lines), match_line + 200)):
             line = lines[i]
             
-            # Check if we hit a new log entry
-            for pattern in self.compiled_end:
-                if pattern.match(line):
-                    return start, end, format_type
-            
-            # Check if this is continuation
-            is_continuation = any(p.match(line) for p in self.compiled_continuation)
+            if self.end_match(line):
+                # We hit a new log entry
+                return start, end, format_type
             
-            if is_continuation:
+            if continuation_match(line):
                 end = i
                 in_stack = True
             elif in_stack and not line.strip():
                 # Empty line after stack, might be end
                 end = i
                 # Check next line to be sure
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1]
-                    if not any(p.match(next_line) for p in self.compiled_continuation):
-                        break
-            elif not is_continuation and line.strip():
+                if i + 1 < len(lines) and not continuation_match(lines[i + 1]):
+                    break
+            elif line.strip():
                 # Non-continuation content, stop here
                 break
         
@@ -292,28 +653,24 @@ class CorrelationTracker:
             r'X-Request-Id:\s*([a-zA-Z0-9\-_]+)',
             r'"x-request-id"\s*:\s*"([^"]+)"',
         ]
-        self.compiled_patterns = [re.compile(p, re.IGNORECASE) for p in self.correlation_patterns]
-        self.correlation_index = defaultdict(list)
-        self.id_to_entries = defaultdict(list)
-    
-    def extract_ids(self, line: str, line_num: int, file_path: str) -> Set[str]:
-        """Extract all correlation IDs from a line"""
-        ids = set()
-        for pattern in self.compiled_patterns:
-            matches = pattern.findall(line)
-            for match in matches:
-                if match and len(match) > 5:  # Avoid very short IDs
-                    ids.add(match)
-                    self.id_to_entries[match].append({
-                        'line': line,
-                        'line_num': line_num,
-                        'file': file_path
-                    })
-        return ids
+        # One alternation instead of ten findall calls per line; every branch has
+        # a single group, so the match's lastindex is the ID it captured
+        self.id_regex = re2.compile('|'.join(self.correlation_patterns), re2.IGNORECASE)
+        # Only occurrences are kept: count_ids tallies every line of the file and
+        # related_count reports the tally for a matched line's ID
+        self.id_counts = Counter()
+    
+    def count_ids(self, line: str):
+        """Count the correlation IDs in a line without recording the sighting"""
+        id_counts = self.id_counts
+        for m in self.id_regex.finditer(line):
+            match = m[m.lastindex]
+            if len(match) > 5:  # Avoid very short IDs
+                id_counts[match] += 1
     
-    def get_related_entries(self, correlation_id: str) -> List[Dict[str, Any]]:
-        """Get all log entries with the same correlation ID"""
-        return self.id_to_entries.get(correlation_id, [])
+    def related_count(self, correlation_id: str) -> int:
+        """Number of log entries with the same correlation ID"""
+        return self.id_counts.get(correlation_id, 0)
 
 
 class FalsePositiveFilter:
@@ -490,34 +847,95 @@ class FalsePositiveFilter:
         # Compile all patterns for efficiency
         self.compiled_worker_patterns = [re.compile(p, re.IGNORECASE) for p in self.worker_class_patterns]
         self.compiled_false_positive_patterns = [re.compile(p, re.IGNORECASE) for p in self.false_positive_patterns]
+        
+        # Without Hyperscan each regex is guarded by a literal it requires (None for
+        # the few with none, which are all ^-anchored and fail fast): an `in` test
+        # on the lowercased line is far cheaper than a case-insensitive search
+        # that retries at every offset
+        self.false_positive_checks = self._literal_guarded(self.false_positive_patterns, self.compiled_false_positive_patterns)
+        self.worker_checks = self._literal_guarded(self.worker_class_patterns, self.compiled_worker_patterns)
+        
+        # Running ~120 regexes on every line was most of the scan time. With
+        # Hyperscan one pass reports which of them can match (false positive
+        # patterns first, then worker patterns, by index) and only those run.
+        self.hyperscan_db = _false_positive_db(tuple(self.false_positive_patterns + self.worker_class_patterns)) if USE_HYPERSCAN else None
+        self._hits: List[int] = []
+        self._on_hit = lambda index, start, end, flags, context: self._hits.append(index)
     
-    def is_false_positive(self, line: str, file_path: Path = None) -> bool:
-        """Check if a line is a false positive"""
+    def is_false_positive(self, line: str, file_path: Path = None, line_lower: Optional[str] = None) -> bool:
+        """Check if a line is a false positive; pass line_lower if the caller already has it"""
+        if self.hyperscan_db is not None:
+            return self._is_false_positive_hyperscan(line)
+        
+        # The guards are exact for ASCII lines only: IGNORECASE also folds a few
+        # other characters onto ASCII letters (e.g. 'ſ' matches 's')
+        if not line.isascii():
+            line_lower = None
+        elif line_lower is None:
+            line_lower = line.lower()
+        
         # Check false positive patterns
-        for fp_pattern in self.compiled_false_positive_patterns:
+        for literal, fp_pattern in self.false_positive_checks:
+            if literal and line_lower is not None and literal not in line_lower:
+                continue
             if fp_pattern.search(line):
                 return True
         
-        # Check worker class names
-        for worker_pattern in self.compiled_worker_patterns:
+        # Check worker class names (every worker pattern ends in a ...Worker class
+        # name, so one test rules them all out on almost every line)
+        if line_lower is not None and 'worker' not in line_lower:
+            return False
+        for literal, worker_pattern in self.worker_checks:
+            if literal and line_lower is not None and literal not in line_lower:
+                continue
             if worker_pattern.search(line):
-                # Check if it's a real error despite having Worker in name
-                if '"severity":"ERROR"' in line or '"level":"error"' in line:
-                    if '"exception":"' in line or 'error":"' in line:
-                        return False  # Real error
-                return True
-        
+                return self._is_worker_noise(line)
+
         return False
     
+    @staticmethod
+    def _literal_guarded(patterns: List[str], compiled: List[re.Pattern]) -> List[Tuple[Optional[str], re.Pattern]]:
+        """Pair each compiled regex with the lowercased literal every match contains"""
+        checks = []
+        for pattern, regex in zip(patterns, compiled):
+            triggers = extract_trigger_words(pattern)
+            checks.append((next(iter(triggers)) if len(triggers) == 1 else None, regex))
+        return checks
+    
+    def _is_false_positive_hyperscan(self, line: str) -> bool:
+        """is_false_positive, running only the regexes the Hyperscan prefilter hit"""
+        hits = self._hits
+        hits.clear()
+        self.hyperscan_db.scan(line.encode('utf-8', 'replace'), match_event_handler=self._on_hit)
+        if not hits:
+            return False
+        
+        # Any confirmed false positive pattern wins over the worker check
+        fp_patterns = self.compiled_false_positive_patterns
+        worker_hit = False
+        for index in hits:
+            if index < len(fp_patterns):
+                if fp_patterns[index].search(line):
+                    return True
+            elif not worker_hit:
+                worker_hit = self.compiled_worker_patterns[index - len(fp_patterns)].search(line) is not None
+        
+        return worker_hit and self._is_worker_noise(line)
+    
+    def _is_worker_noise(self, line: str) -> bool:
+        """A line naming an error-sounding worker class is noise unless it logs a real error"""
+        # Check if it's a real error despite having Worker in name
+        if '"severity":"ERROR"' in line or '"level":"error"' in line:
+            if '"exception":"' in line or 'error":"' in line:
+                return False  # Real error
+        return True
+    
     def is_schema_file(self, file_path: Path) -> bool:
         """Check if file is a database schema file"""
         filename = file_path.name.lower()
         
-        for schema_indicator in self.schema_files:
-            if schema_indicator.lower() in filename:
-                return True
-        
-        return False
+        # The indicators are stored lowercase
+        return any(schema_indicator in filename for schema_indicator in self.schema_files)
     
     def is_system_info_file(self, file_path: Path) -> bool:
         """Check if file is a system info file"""
@@ -526,10 +944,8 @@ class FalsePositiveFilter:
         if filename in self.system_info_files:
             return True
         
-        if any(cmd in filename for cmd in ['top_', 'df_', 'iostat', 'sar_', 'ps_', 'ps']):
-            return True
-        
-        return False
+        # 'ps' also covers 'ps_'
+        return any(cmd in filename for cmd in ('top_', 'df_', 'iostat', 'sar_', 'ps'))
     
     def is_config_file(self, file_path: Path) -> bool:
         """Check if file is a configuration file"""
@@ -544,6 +960,10 @@ class FalsePositiveFilter:
         
         return False
     
+    def is_skipped_file(self, file_path: Path) -> bool:
+        """Check if file is never scanned (schema, system info or config file)"""
+        return self.is_schema_file(file_path) or self.is_system_info_file(file_path) or self.is_config_file(file_path)
+    
     def is_monitoring_service_error(self, line: str, file_path: str) -> Tuple[bool, Optional[str]]:
         """Check if error is from monitoring infrastructure"""
         line_lower = line.lower()
@@ -562,11 +982,43 @@ class TurboStreamProcessor:
     # CONSTANTS - No more magic numbers!
     MMAP_THRESHOLD_BYTES = 50 * 1024 * 1024  # 50MB
     MMAP_CHUNK_SIZE = 10 * 1024 * 1024  # 10MB
-    MAX_LINES_IN_MEMORY = 1_000_000  # Safety limit for readlines()
     CONTEXT_LINES_BEFORE = 10
     CONTEXT_LINES_AFTER = 10
     MAX_BOUNDARY_SEARCH_BACK = 100
     MAX_BOUNDARY_SEARCH_FORWARD = 200
+    WINDOW_TRIM_LINES = 4096  # Slack before the sliding window drops old lines
+    
+    # Map file types to relevant components
+    RELEVANCE_MAP = {
+        'sidekiq': ['Sidekiq', 'Rails', 'Redis'],
+        'gitaly': ['Praefect/Gitaly', 'Git/Shell'],
+        'praefect': ['Praefect/Gitaly'],
+        'postgresql': ['PostgreSQL'],
+        'postgres': ['PostgreSQL'],
+        'redis': ['Redis'],
+        'nginx': ['Nginx', 'Network'],
+        'workhorse': ['Workhorse', 'Rails', 'Network'],
+        'gitlab-rails': ['Rails', 'Auth', 'Geo'],
+        'puma': ['Puma/Workhorse', 'Rails'],
+        'production': ['Rails'],
+        'api_json': ['Rails'],
+        'application': ['Rails'],
+        # Docker/Container runtime
+        'docker': ['Docker/Containerd'],
+        'containerd': ['Docker/Containerd'],
+        'container': ['Docker/Containerd', 'Kubernetes/Helm'],
+        'cri-o': ['Docker/Containerd'],
+        # Kubernetes
+        'kube': ['Kubernetes/Helm'],
+        'k8s': ['Kubernetes/Helm'],
+        'helm': ['Kubernetes/Helm'],
+        'ingress': ['Kubernetes/Helm'],
+        'pod': ['Kubernetes/Helm'],
+        'deployment': ['Kubernetes/Helm'],
+    }
+    
+    # Generic components (always checked)
+    GENERIC_COMPONENTS = ('System/OS', 'Network', 'Generic', 'SSL/Certificates')
     
     def __init__(self, pattern_bank: 'EnhancedPatternBank', false_positive_filter: FalsePositiveFilter = None):
         self.pattern_bank = pattern_bank
@@ -574,32 +1026,21 @@ class TurboStreamProcessor:
         self.boundary_detector = LogBoundaryDetector()
         # REMOVED: self.correlation_tracker - will create per-file instead
         self.automaton = pattern_bank.automaton if HAS_AHOCORASICK else None
-        self.quick_filters = self._build_quick_filters()
+        self.quick_filters = pattern_bank.quick_filters
+        self.quick_filter_search = pattern_bank.quick_filter_search
+        self.unanchored_search = pattern_bank.unanchored_regex.search if pattern_bank.unanchored_regex else None
+        self.hyperscan_db = pattern_bank.hyperscan_db
+        self._extractor_cache: Dict[str, Tuple[re.Pattern, ...]] = {}
+        # Files of the same type share a scan plan, keyed by their relevant components
+        self._scan_plans: Dict[frozenset, Tuple[List[Tuple[ErrorPattern, Any, Optional[str], frozenset]], Dict[str, int]]] = {}
     
-    def _build_quick_filters(self) -> Set[str]:
-        """Build set of quick filter strings for pre-checking"""
-        filters = set()
-        # Extract key error indicators from patterns
-        for pattern in self.pattern_bank.patterns:
-            # Extract simple strings from regex patterns
-            simple_strings = re.findall(r'[a-z]+', pattern.pattern.lower())
-            filters.update(s for s in simple_strings if len(s) > 3)
-        # Add common error indicators
-        filters.update(['error', 'fail', 'fatal', 'panic', 'exception', 
-                       'critical', 'timeout', 'refused', 'unavailable',
-                       'abort', 'crash', 'corrupt', 'invalid', 'violation'])
-        return filters
-    
-    async def process_file_streaming(self, file_path: Path, result_queue: AsyncQueue) -> int:
-        """Process file with streaming results"""
+    async def process_file_streaming(self, file_path: Path, result_queue: AsyncQueue,
+                                     byte_range: Optional[Tuple[int, int]] = None) -> int:
+        """Process file (or one byte range of a huge file) with streaming results"""
         errors_found = 0
         
         # Skip false positive files
-        if self.false_positive_filter.is_schema_file(file_path):
-            return 0
-        if self.false_positive_filter.is_system_info_file(file_path):
-            return 0
-        if self.false_positive_filter.is_config_file(file_path):
+        if self.false_positive_filter.is_skipped_file(file_path):
             return 0
         
         try:
@@ -607,7 +1048,9 @@ class TurboStreamProcessor:
             file_size = file_path.stat().st_size
             use_mmap = file_size > self.MMAP_THRESHOLD_BYTES and not str(file_path).endswith('.gz')
             
-            if use_mmap:
+            if byte_range:
+                errors_found = await self._process_mmap(file_path, result_queue, *byte_range)
+            elif use_mmap:
                 errors_found = await self._process_mmap(file_path, result_queue)
             else:
                 errors_found = await self._process_regular(file_path, result_queue)
@@ -617,6 +1060,13 @@ class TurboStreamProcessor:
         
         return errors_found
     
+    @staticmethod
+    def _open_text(file_path: Path):
+        """Open a (possibly gzipped) log file for line-by-line text reading"""
+        if str(file_path).endswith('.gz'):
+            return gzip_open(file_path, 'rt', encoding='utf-8', errors='ignore')
+        return open(file_path, 'r', encoding='utf-8', errors='ignore')
+    
     async def _process_regular(self, file_path: Path, result_queue: AsyncQueue) -> int:
         """Regular file processing with streaming and context preservation"""
         errors_found = 0
@@ -625,147 +1075,202 @@ class TurboStreamProcessor:
         correlation_tracker = CorrelationTracker()
         
         # Get relevant patterns for this file type
-        relevant_patterns = self._get_relevant_patterns(file_path)
+        scan_plan, plan_index = self._scan_plan_for(file_path)
+        
+        # Per-file values, resolved once rather than for every match
+        file_name = str(file_path)
+        node = self._extract_node(file_path)
+        
+        # Single pass: correlation IDs are counted as lines stream through the
+        # window, so matches are held until the end of the file, when their
+        # related_entries_count is complete
+        pending_matches: List[EnhancedErrorMatch] = []
+
+        # Lines up to here belong to an error already reported. Matches only
+        # happen past the previous error's end, so one index covers them all
+        processed_through = -1
+        search_back = self.MAX_BOUNDARY_SEARCH_BACK
+        count_ids = correlation_tracker.count_ids
+        
+        # Nearby matches show the same lines as full_line and context: each is
+        # stripped once and shared, so the pickled results carry it once
+        stripped_lines: Dict[int, str] = {}
+        
+        def stripped(number: int) -> str:
+            text = stripped_lines.get(number)
+            if text is None:
+                text = stripped_lines[number] = window[number - base].rstrip()
+            return text
         
-        # CRITICAL FIX: Stream large files instead of loading all into memory
         try:
-            if str(file_path).endswith('.gz'):
-                file_handle = gzip.open(file_path, 'rt', encoding='utf-8', errors='ignore')
-            else:
-                file_handle = open(file_path, 'r', encoding='utf-8', errors='ignore')
-            
-            # Read file into lines list (with safety limit)
-            lines = []
-            for idx, line in enumerate(file_handle):
-                lines.append(line)
-                if idx >= self.MAX_LINES_IN_MEMORY:
-                    print(f"⚠️  File {file_path.name} exceeds {self.MAX_LINES_IN_MEMORY} lines, truncating for safety")
-                    break
-            
-            file_handle.close()
-            
+            file_size = file_path.stat().st_size
+            file_handle = self._open_text(file_path)
         except Exception as e:
             print(f"Failed to read {file_path}: {e}")
             return 0
         
-        # First pass: Build correlation index
-        for idx, line in enumerate(lines):
-            correlation_tracker.extract_ids(line, idx, str(file_path))
-        
-        # Second pass: Process errors with context
-        line_buffer = deque(maxlen=self.CONTEXT_LINES_BEFORE)
-        processed_lines = set()  # Track processed lines to avoid duplicates
-        
-        for line_number, line in enumerate(lines):
-            # Skip if already processed as part of another error's context
-            if line_number in processed_lines:
-                line_buffer.append(line.rstrip())
-                continue
-            
-            # Quick pre-filter
-            if not self._quick_check(line):
-                line_buffer.append(line.rstrip())
-                continue
-            
-            # Check for false positives
-            if self.false_positive_filter.is_false_positive(line, file_path):
-                line_buffer.append(line.rstrip())
-                continue
-            
-            # Check patterns
-            for pattern in relevant_patterns:
-                if pattern.id in self.pattern_bank.compiled_patterns:
-                    regex = self.pattern_bank.compiled_patterns[pattern.id]
-                    match = regex.search(line)
+        try:
+            with file_handle:
+                window = list(islice(file_handle, self.MAX_BOUNDARY_SEARCH_FORWARD + 1))
+                for line in window:
+                    count_ids(line)
+                base = 0  # Line number of window[0]
+                
+                for line_number in count():
+                    idx = line_number - base
+                    if idx >= len(window):
+                        break
+                    line = window[idx]
                     
-                    if match:
-                        # Find error boundaries for full context
-                        start, end, format_type = self.boundary_detector.find_boundaries(lines, line_number)
-                        
-                        # Mark these lines as processed
-                        for i in range(start, end + 1):
-                            processed_lines.add(i)
-                        
-                        # Extract full context
-                        context_lines = lines[start:end+1]
-                        full_context = ''.join(context_lines)
-                        
-                        # Extract clean message
-                        clean_message = self._extract_clean_message(line, pattern, context_lines)
-                        
-                        # Create enhanced match
-                        error_match = EnhancedErrorMatch(
-                            pattern=pattern,
-                            matched_text=match.group(0),
-                            clean_message=clean_message,
-                            full_line=line.rstrip(),
-                            file_path=str(file_path),
-                            line_number=line_number + 1,
-                            context_before=list(line_buffer)[-5:] if line_buffer else [],
-                            context_after=[lines[i].rstrip() for i in range(line_number + 1, min(line_number + 6, len(lines)))],
-                            full_context_text=full_context,
-                            node=self._extract_node(file_path),
-                            timestamp=self._extract_timestamp(line)
-                        )
-                        
-                        # Extract additional metadata
-                        self._extract_metadata(line, error_match, context_lines)
-                        
-                        # Extract stack trace if present
-                        if format_type in ['python_stack', 'java_stack', 'go_stack', 'ruby']:
-                            error_match.stack_trace = self._extract_stack_trace(context_lines, format_type)
+                    # Keep the window filled MAX_BOUNDARY_SEARCH_FORWARD lines ahead
+                    next_line = file_handle.readline()
+                    if next_line:
+                        window.append(next_line)
+                        count_ids(next_line)
+                    
+                    # Drop lines the backward search can no longer reach
+                    if idx > search_back + self.WINDOW_TRIM_LINES:
+                        del window[:idx - search_back]
+                        base = line_number - search_back
+                        idx = search_back
+                        stripped_lines.clear()
+                    
+                    # Skip if already processed as part of another error's context
+                    if line_number <= processed_through:
+                        continue
+                    
+                    # Lowercased once for the pre-filter, false positive guards and routing
+                    line_lower = line.lower()
+                    
+                    # Quick pre-filter
+                    if not self._quick_check(line, line_lower):
+                        continue
+                    
+                    # Check for false positives
+                    if self.false_positive_filter.is_false_positive(line, file_path, line_lower):
+                        continue
+                    
+                    # Check patterns
+                    for pattern, search, token, triggers in self._route_line(scan_plan, plan_index, line, line_lower):
+                        # Severity-prefixed patterns can't match without their token
+                        if token and token not in line_lower:
+                            continue
                         
-                        # Get correlation info
-                        if error_match.correlation_id:
-                            related = correlation_tracker.get_related_entries(error_match.correlation_id)
-                            error_match.json_fields['related_entries_count'] = len(related)
+                        match = search(line)
                         
-                        # Send to result queue
+                        if match:
+                            # Find error boundaries for full context
+                            start, end, format_type = self.boundary_detector.find_boundaries(window, idx)
+                            
+                            # Mark these lines as processed
+                            processed_through = base + end
+                            
+                            # Extract full context
+                            context_lines = window[start:end+1]
+                            full_context = ''.join(context_lines)
+                            
+                            # Extract clean message
+                            line_json = self._parse_json_line(line)
+                            clean_message = self._extract_clean_message(line, pattern, line_json, context_lines)
+                            
+                            # Create enhanced match
+                            error_match = EnhancedErrorMatch(
+                                pattern=pattern,
+                                matched_text=match.group(0),
+                                clean_message=clean_message,
+                                full_line=stripped(line_number),
+                                file_path=file_name,
+                                line_number=line_number + 1,
+                                context_before=[stripped(n) for n in range(max(base, line_number - 5), line_number)],
+                                context_after=[stripped(n) for n in range(line_number + 1, min(line_number + 6, base + len(window)))],
+                                full_context_text=full_context,
+                                node=node,
+                                timestamp=self._extract_timestamp(line)
+                            )
+                            
+                            # Extract additional metadata
+                            self._extract_metadata(line, error_match, line_json, context_lines)
+                            
+                            # Extract stack trace if present
+                            if format_type in ['python_stack', 'java_stack', 'go_stack', 'ruby']:
+                                error_match.stack_trace = self._extract_stack_trace(context_lines, format_type)
+                            
+                            pending_matches.append(error_match)
+                            errors_found += 1
+                            break  # Move to next line after finding a match
+                    
+                    # Progress update every 1000 lines, by bytes read from disk
+                    if line_number > 0 and line_number % 1000 == 0:
+                        offset = os.lseek(file_handle.fileno(), 0, os.SEEK_CUR)
                         await result_queue.put({
-                            'type': 'error',
-                            'data': error_match.to_dict()
+                            'type': 'progress',
+                            'file': file_name,
+                            'lines_processed': line_number,
+                            'progress_percent': min(offset / max(file_size, 1), 1.0) * 100
                         })
-                        
-                        errors_found += 1
-                        break  # Move to next line after finding a match
-            
-            line_buffer.append(line.rstrip())
-            
-            # Progress update every 1000 lines
-            if line_number > 0 and line_number % 1000 == 0:
+        finally:
+            # Matches found before a failure mid-file are still reported
+            for error_match in pending_matches:
+                # Get correlation info
+                if error_match.correlation_id:
+                    error_match.json_fields['related_entries_count'] = correlation_tracker.related_count(error_match.correlation_id)
+                
+                # Send to result queue
                 await result_queue.put({
-                    'type': 'progress',
-                    'file': str(file_path),
-                    'lines_processed': line_number,
-                    'total_lines': len(lines),
-                    'progress_percent': (line_number / len(lines)) * 100
+                    'type': 'error',
+                    'data': error_match.to_dict()
                 })
         
         return errors_found
     
-    async def _process_mmap(self, file_path: Path, result_queue: AsyncQueue) -> int:
-        """Memory-mapped file processing for huge files"""
+    async def _process_mmap(self, file_path: Path, result_queue: AsyncQueue,
+                            start: int = 0, end: Optional[int] = None) -> int:
+        """Memory-mapped file processing for huge files (lines starting in [start, end))"""
         errors_found = 0
         
         # CRITICAL FIX: Create correlation tracker per-file
         correlation_tracker = CorrelationTracker()
         
-        relevant_patterns = self._get_relevant_patterns(file_path)
+        scan_plan, plan_index = self._scan_plan_for(file_path)
+        file_name = str(file_path)
+        node = self._extract_node(file_path)
         
         with open(file_path, 'r+b') as f:
             with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mmapped_file:
                 # Process in chunks
                 chunk_size = self.MMAP_CHUNK_SIZE
-                offset = 0
+                limit = len(mmapped_file) if end is None else min(end, len(mmapped_file))
+                
+                # The range is read front to back once: ask for aggressive readahead
+                # (madvise is missing on some platforms)
+                can_advise = hasattr(mmap, 'MADV_SEQUENTIAL')
+                if can_advise:
+                    mmapped_file.madvise(mmap.MADV_SEQUENTIAL)
                 line_buffer = deque(maxlen=self.CONTEXT_LINES_BEFORE)
                 
-                while offset < len(mmapped_file):
+                # A range that starts mid-line leaves that line to the previous
+                # range, and seeds its context from the lines just before it
+                if start > 0:
+                    if mmapped_file[start-1:start] != b'\n':
+                        newline = mmapped_file.find(b'\n', start)
+                        start = len(mmapped_file) if newline == -1 else newline + 1
+                    preceding = mmapped_file[max(0, start - 64 * 1024):start].decode('utf-8', errors='ignore')
+                    line_buffer.extend(line for line in preceding.split('\n') if line)
+                offset = start
+                
+                while offset < limit:
                     # Read chunk
-                    end_offset = min(offset + chunk_size, len(mmapped_file))
+                    end_offset = min(offset + chunk_size, limit)
+                    
+                    # Extend to the end of the line the chunk stops in
+                    if end_offset < len(mmapped_file):
+                        newline = mmapped_file.find(b'\n', end_offset - 1)
+                        end_offset = len(mmapped_file) if newline == -1 else newline + 1
                     
-                    # Find line boundary
-                    while end_offset < len(mmapped_file) and mmapped_file[end_offset-1:end_offset] != b'\n':
-                        end_offset += 1
+                    # Have the kernel page in the next chunk while this one is scanned
+                    if can_advise and end_offset < limit:
+                        ahead = end_offset - end_offset % mmap.PAGESIZE
+                        mmapped_file.madvise(mmap.MADV_WILLNEED, ahead, min(chunk_size, len(mmapped_file) - ahead))
                     
                     chunk = mmapped_file[offset:end_offset].decode('utf-8', errors='ignore')
                     lines = chunk.split('\n')
@@ -774,36 +1279,39 @@ class TurboStreamProcessor:
                         if not line:
                             continue
                         
-                        if self._quick_check(line) and not self.false_positive_filter.is_false_positive(line):
-                            for pattern in relevant_patterns:
-                                if pattern.id in self.pattern_bank.compiled_patterns:
-                                    regex = self.pattern_bank.compiled_patterns[pattern.id]
-                                    match = regex.search(line)
+                        line_lower = line.lower()
+                        if self._quick_check(line, line_lower) and not self.false_positive_filter.is_false_positive(line, line_lower=line_lower):
+                            for pattern, search, token, triggers in self._route_line(scan_plan, plan_index, line, line_lower):
+                                if token and token not in line_lower:
+                                    continue
+                                
+                                match = search(line)
+                                
+                                if match:
+                                    line_json = self._parse_json_line(line)
+                                    clean_message = self._extract_clean_message(line, pattern, line_json)
                                     
-                                    if match:
-                                        clean_message = self._extract_clean_message(line, pattern)
-                                        
-                                        error_match = EnhancedErrorMatch(
-                                            pattern=pattern,
-                                            matched_text=match.group(0),
-                                            clean_message=clean_message,
-                                            full_line=line,
-                                            file_path=str(file_path),
-                                            line_number=0,  # Line numbers not available with mmap
-                                            context_before=list(line_buffer)[-5:],
-                                            node=self._extract_node(file_path),
-                                            timestamp=self._extract_timestamp(line)
-                                        )
-                                        
-                                        self._extract_metadata(line, error_match)
-                                        
-                                        await result_queue.put({
-                                            'type': 'error',
-                                            'data': error_match.to_dict()
-                                        })
-                                        
-                                        errors_found += 1
-                                        break
+                                    error_match = EnhancedErrorMatch(
+                                        pattern=pattern,
+                                        matched_text=match.group(0),
+                                        clean_message=clean_message,
+                                        full_line=line,
+                                        file_path=file_name,
+                                        line_number=0,  # Line numbers not available with mmap
+                                        context_before=list(line_buffer)[-5:],
+                                        node=node,
+                                        timestamp=self._extract_timestamp(line)
+                                    )
+                                    
+                                    self._extract_metadata(line, error_match, line_json)
+                                    
+                                    await result_queue.put({
+                                        'type': 'error',
+                                        'data': error_match.to_dict()
+                                    })
+                                    
+                                    errors_found += 1
+                                    break
                         
                         line_buffer.append(line)
                     
@@ -812,70 +1320,166 @@ class TurboStreamProcessor:
                     # Progress update
                     await result_queue.put({
                         'type': 'progress',
-                        'file': str(file_path),
-                        'progress_percent': (offset / len(mmapped_file)) * 100
+                        'file': file_name,
+                        'progress_percent': ((offset - start) / max(limit - start, 1)) * 100
                     })
         
         return errors_found
     
-    def _quick_check(self, line: str) -> bool:
+    def _scan_plan_for(self, file_path: Path) -> Tuple[List[Tuple[ErrorPattern, Any, Optional[str], frozenset]], Dict[str, int]]:
+        """Scan plan for this file type, built once per set of relevant components"""
+        components = self._get_relevant_components(file_path)
+        plan = self._scan_plans.get(components)
+        if plan is None:
+            plan = self._scan_plans[components] = self._build_scan_plan(self.pattern_bank.patterns_for(components))
+        return plan
+    
+    def _build_scan_plan(self, patterns: List[ErrorPattern]) -> Tuple[List[Tuple[ErrorPattern, Any, Optional[str], frozenset]], Dict[str, int]]:
+        """Resolve each pattern's bound search method, prefix token and trigger words"""
+        compiled = self.pattern_bank.compiled_patterns
+        leading_tokens = self.pattern_bank.leading_tokens
+        scan_plan = [
+            (pattern, compiled[pattern.id].search, leading_tokens.get(pattern.id), pattern.trigger_words)
+            for pattern in patterns
+            if pattern.id in compiled
+        ]
+        plan_index = {entry[0].id: i for i, entry in enumerate(scan_plan)}
+        return scan_plan, plan_index
+    
+    def _route_line(self, scan_plan: List[Tuple[ErrorPattern, Any, Optional[str], frozenset]],
+                    plan_index: Dict[str, int], line: str, line_lower: str) -> Iterator[Tuple[ErrorPattern, Any, Optional[str], frozenset]]:
+        """Scan-plan entries worth running on this line, still in plan order"""
+        # With a multi-pattern matcher only its handful of candidates are visited,
+        # instead of stepping through the whole plan in Python for every line
+        candidates = self._candidate_patterns(line, line_lower)
+        if candidates is not None:
+            entries = [scan_plan[i] for i in sorted(plan_index[c] for c in candidates if c in plan_index)]
+            return self._linear_entries(entries) if len(line) >= LINEAR_MATCH_MIN_CHARS else entries
+        
+        # Without one, whole components are ruled out first, then anchored patterns
+        # need one of their trigger words and the rest a hit from their fused alternation
+        absent = {
+            component for component, words in self.pattern_bank.component_words.items()
+            if not any(w in line_lower for w in words)
+        }
+        unanchored_hit = self._unanchored_hit(line)
+        entries = (
+            entry for entry in scan_plan
+            if entry[0].component not in absent
+            and (any(t in line_lower for t in entry[3]) if entry[3] else unanchored_hit)
+        )
+        return self._linear_entries(entries) if len(line) >= LINEAR_MATCH_MIN_CHARS else entries
+    
+    @staticmethod
+    def _linear_entries(entries: Iterable[Tuple[ErrorPattern, Any, Optional[str], frozenset]]) -> Iterator[Tuple[ErrorPattern, Any, Optional[str], frozenset]]:
+        """Same entries, searching with each pattern's RE2 twin where it has one"""
+        for pattern, search, token, triggers in entries:
+            yield (pattern, pattern.linear.search if pattern.linear else search, token, triggers)
+    
+    def _candidate_patterns(self, line: str, line_lower: str) -> Optional[Set[str]]:
+        """Ids of the patterns that may match the line (None without Hyperscan or Aho-Corasick)"""
+        if self.hyperscan_db:
+            # Prefilter mode over-approximates, so the regexes still confirm each hit
+            pattern_ids = self.pattern_bank.hyperscan_ids
+            candidates = set()
+            
+            def on_match(index, start, end, flags, context):
+                candidates.add(pattern_ids[index])
+            
+            self.hyperscan_db.scan(line.encode('utf-8', 'replace'), match_event_handler=on_match)
+            return candidates
+        
+        if not self.automaton:
+            return None
+        
+        candidates = set()
+        found = set()
+        for _, (word, pattern_ids) in self.automaton.iter(line_lower):
+            found.add(word)
+            candidates.update(pattern_ids)
+        
+        # Anchor hits still need the pattern's other required words on the line
+        required_words = self.pattern_bank.required_words
+        candidates = {c for c in candidates if c not in required_words or required_words[c] <= found}
+        if self._unanchored_hit(line):
+            candidates.update(self.pattern_bank.unanchored_ids)
+        return candidates
+    
+    def _unanchored_hit(self, line: str) -> bool:
+        """Whether any pattern without a literal anchor could match the line"""
+        if not self.unanchored_search:
+            return True
+        return self.unanchored_search(line) is not None
+    
+    def _quick_check(self, line: str, line_lower: str) -> bool:
         """Ultra-fast pre-check using Aho-Corasick or simple string matching"""
         if not line or len(line) < 10:
             return False
         
-        line_lower = line.lower()
-        
         # Use Aho-Corasick if available
         if self.automaton and HAS_AHOCORASICK:
             try:
-                for end_index, pattern in self.automaton.iter(line_lower):
-                    return True
+                # Words that only narrow candidates (no pattern ids) don't pass the line
+                for _, (word, pattern_ids) in self.automaton.iter(line_lower):
+                    if pattern_ids or word in self.quick_filters:
+                        return True
                 return False
             except Exception:  # FIXED: Don't catch KeyboardInterrupt!
                 pass
         
-        # Fallback to quick string checks
-        return any(indicator in line_lower for indicator in self.quick_filters)
+        # Fallback to a single search for any of the words
+        return self.quick_filter_search(line_lower) is not None
     
-    def _extract_clean_message(self, line: str, pattern: ErrorPattern, context_lines: List[str] = None) -> str:
-        """Extract clean, human-readable error message"""
-        
-        # Try JSON extraction first
-        if line.strip().startswith('{'):
+    @staticmethod
+    def _parse_json_line(line: str) -> Optional[dict]:
+        """Parse a JSON log line once for message and metadata extraction; None if it isn't one"""
+        if line.lstrip().startswith('{'):
             try:
-                data = json.loads(line)
-                
-                # For exception.class, try to get the full message
-                exception_class = data.get('exception.class') or data.get('exception', {}).get('class')
-                exception_message = data.get('exception.message') or data.get('exception', {}).get('message')
-                
-                # Combine class and message if both exist
-                if exception_class and exception_message:
-                    return f"{exception_class}: {exception_message}"
-                
-                # Priority order for message extraction
-                message = (
-                    exception_message or
-                    data.get('error_message') or
-                    exception_class or
-                    data.get('error') or
-                    data.get('msg') or
-                    data.get('message', '')
-                )
-                
-                # Clean up common noise
-                if message and message not in ['bulk_exception', 'exception', 'error']:
-                    return message
-                    
+                return json_loads(line)
             except json.JSONDecodeError:
                 pass
+        return None
+    
+    def _extract_clean_message(self, line: str, pattern: ErrorPattern, line_json: Optional[dict],
+                               context_lines: List[str] = None) -> str:
+        """Extract clean, human-readable error message (line_json from _parse_json_line)"""
+        
+        # Try JSON extraction first
+        if line_json is not None:
+            data = line_json
+            
+            # For exception.class, try to get the full message (Rails logs may
+            # carry "exception" as a plain string rather than an object)
+            exception = data.get('exception')
+            if not isinstance(exception, dict):
+                exception = {}
+            exception_class = data.get('exception.class') or exception.get('class')
+            exception_message = data.get('exception.message') or exception.get('message')
+            
+            # Combine class and message if both exist
+            if exception_class and exception_message:
+                return f"{exception_class}: {exception_message}"
+            
+            # Priority order for message extraction
+            message = (
+                exception_message or
+                data.get('error_message') or
+                exception_class or
+                data.get('error') or
+                data.get('msg') or
+                data.get('message', '')
+            )
+            
+            # Clean up common noise
+            if message and message not in ['bulk_exception', 'exception', 'error']:
+                return message
         
         # Check context lines for better message
         if context_lines:
             for ctx_line in context_lines[:5]:  # Check first 5 lines
-                if ctx_line.strip().startswith('{'):
+                if ctx_line.lstrip().startswith('{'):
                     try:
-                        data = json.loads(ctx_line)
+                        data = json_loads(ctx_line)
                         message = (
                             data.get('error_message') or
                             data.get('exception', {}).get('message') or
@@ -886,69 +1490,49 @@ class TurboStreamProcessor:
                     except:
                         pass
         
-        # Pattern-specific extraction
-        extractors = {
-            'ssl': r'(?:error|failed):\s*(.+?)(?:\n|$)',
-            'timeout': r'timeout.*?:\s*(.+?)(?:\n|$)',
-            'connection': r'connection.*?:\s*(.+?)(?:\n|$)',
-            'postgres': r'ERROR:\s*(.+?)(?:\n|$)',
-            'grpc': r'desc\s*=\s*"?([^"]+)"?',
-            'redis': r'(?:Redis|REDIS).*?:\s*(.+?)(?:\n|$)',
-            'sidekiq': r'(?:failed|error):\s*(.+?)(?:\n|$)',
-        }
-        
-        for key, extractor in extractors.items():
-            if key in pattern.id.lower() or key in pattern.component.lower():
-                match = re.search(extractor, line, re.IGNORECASE)
-                if match:
-                    return match.group(1).strip()
-        
-        # Generic extraction
-        error_patterns = [
-            r'(?:ERROR|FATAL|CRITICAL|error|fail)[:\s]+(.+?)(?:\n|$)',
-            r'message[:\s]+["\']*([^"\']+)',
-            r'msg[:\s]+["\']*([^"\']+)',
-        ]
-        
-        for error_pattern in error_patterns:
-            match = re.search(error_pattern, line, re.IGNORECASE)
+        # Pattern-specific extraction, then generic
+        for extractor in self._message_extractors(pattern):
+            match = extractor.search(line)
             if match:
                 return match.group(1).strip()
         
         # Fallback to pattern description
         return pattern.description or pattern.pattern[:100]
     
-    def _extract_metadata(self, line: str, error_match: EnhancedErrorMatch, context_lines: List[str] = None):
-        """Extract all available metadata"""
+    def _message_extractors(self, pattern: ErrorPattern) -> Tuple[re.Pattern, ...]:
+        """Message extractors that apply to a pattern, specific ones first (resolved once per pattern)"""
+        extractors = self._extractor_cache.get(pattern.id)
+        if extractors is None:
+            pattern_id = pattern.id.lower()
+            component = pattern.component.lower()
+            extractors = tuple(
+                extractor for key, extractor in MESSAGE_EXTRACTORS
+                if key in pattern_id or key in component
+            ) + GENERIC_MESSAGE_EXTRACTORS
+            self._extractor_cache[pattern.id] = extractors
+        return extractors
+    
+    def _extract_metadata(self, line: str, error_match: EnhancedErrorMatch, line_json: Optional[dict],
+                          context_lines: List[str] = None):
+        """Extract all available metadata (line_json from _parse_json_line)"""
         
         # JSON extraction
-        if line.strip().startswith('{'):
-            try:
-                data = json.loads(line)
-                error_match.json_fields = data
-                
-                # Extract specific fields
-                error_match.correlation_id = data.get('correlation_id')
-                error_match.request_id = data.get('request_id')
-                error_match.user_id = data.get('user_id')
-                error_match.project_id = data.get('project_id')
-                error_match.job_id = data.get('job_id')
-                error_match.trace_id = data.get('trace_id')
-                error_match.error_code = data.get('code') or data.get('status') or data.get('grpc.code')
-                
-            except json.JSONDecodeError:
-                pass
+        if line_json is not None:
+            data = line_json
+            error_match.json_fields = data
+            
+            # Extract specific fields
+            error_match.correlation_id = data.get('correlation_id')
+            error_match.request_id = data.get('request_id')
+            error_match.user_id = data.get('user_id')
+            error_match.project_id = data.get('project_id')
+            error_match.job_id = data.get('job_id')
+            error_match.trace_id = data.get('trace_id')
+            error_match.error_code = data.get('code') or data.get('status') or data.get('grpc.code')
         
         # Pattern-based extraction
-        patterns = {
-            'correlation_id': r'correlation_id[=:]\s*"?([a-zA-Z0-9\-_]+)"?',
-            'request_id': r'request_id[=:]\s*"?([a-zA-Z0-9\-_]+)"?',
-            'status_code': r'\b([45]\d{2})\s+(?:Error|Bad|Not)',
-            'grpc_code': r'code\s*=\s*(\w+)',
-        }
-        
-        for field, regex in patterns.items():
-            if match := re.search(regex, line, re.IGNORECASE):
+        for field, regex in METADATA_EXTRACTORS:
+            if match := regex.search(line):
                 if field == 'status_code':
                     error_match.error_code = match.group(1)
                 else:
@@ -958,10 +1542,10 @@ class TurboStreamProcessor:
         if context_lines:
             for ctx_line in context_lines:
                 if not error_match.correlation_id:
-                    if match := re.search(r'correlation_id[=:]\s*"?([a-zA-Z0-9\-_]+)"?', ctx_line):
+                    if match := CONTEXT_CORRELATION_RE.search(ctx_line):
                         error_match.correlation_id = match.group(1)
                 if not error_match.error_code:
-                    if match := re.search(r'\b([45]\d{2})\s+', ctx_line):
+                    if match := CONTEXT_STATUS_RE.search(ctx_line):
                         error_match.error_code = match.group(1)
     
     def _extract_stack_trace(self, lines: List[str], format_type: str) -> Optional[List[str]]:
@@ -994,80 +1578,22 @@ class TurboStreamProcessor:
         
         return stack_trace if stack_trace else None
     
-    def _get_relevant_patterns(self, file_path: Path) -> List[ErrorPattern]:
-        """Get patterns relevant to this file type, sorted by priority"""
-        
+    def _get_relevant_components(self, file_path: Path) -> frozenset:
+        """Components whose patterns apply to this file type"""
         path_str = str(file_path).lower()
         filename = file_path.name.lower()
         
-        # Map file types to relevant components
-        relevance_map = {
-            'sidekiq': ['Sidekiq', 'Rails', 'Redis'],
-            'gitaly': ['Praefect/Gitaly', 'Git/Shell'],
-            'praefect': ['Praefect/Gitaly'],
-            'postgresql': ['PostgreSQL'],
-            'postgres': ['PostgreSQL'],
-            'redis': ['Redis'],
-            'nginx': ['Nginx', 'Network'],
-            'workhorse': ['Workhorse', 'Rails', 'Network'],
-            'gitlab-rails': ['Rails', 'Auth', 'Geo'],
-            'puma': ['Puma/Workhorse', 'Rails'],
-            'production': ['Rails'],
-            'api_json': ['Rails'],
-            'application': ['Rails'],
-            # Docker/Container runtime
-            'docker': ['Docker/Containerd'],
-            'containerd': ['Docker/Containerd'],
-            'container': ['Docker/Containerd', 'Kubernetes/Helm'],
-            'cri-o': ['Docker/Containerd'],
-            # Kubernetes
-            'kube': ['Kubernetes/Helm'],
-            'k8s': ['Kubernetes/Helm'],
-            'helm': ['Kubernetes/Helm'],
-            'ingress': ['Kubernetes/Helm'],
-            'pod': ['Kubernetes/Helm'],
-            'deployment': ['Kubernetes/Helm'],
-        }
-        
         # Determine relevant components
-        relevant_components = set()
-        for key, components in relevance_map.items():
+        relevant_components = set(self.GENERIC_COMPONENTS)
+        for key, components in self.RELEVANCE_MAP.items():
             if key in path_str or key in filename:
                 relevant_components.update(components)
-        
-        # Add generic components (always checked)
-        relevant_components.update(['System/OS', 'Network', 'Generic', 'SSL/Certificates'])
-        
-        # Filter patterns by relevance
-        relevant = []
-        for p in self.pattern_bank.patterns:
-            if p.component in relevant_components:
-                relevant.append(p)
-            elif p.severity == 'CRITICAL':
-                relevant.append(p)  # Always include critical patterns
-        
-        # Sort by priority and severity
-        severity_order = {'CRITICAL': 0, 'ERROR': 1, 'WARNING': 2}
-        relevant.sort(key=lambda p: (
-            -p.priority,  # Higher priority first
-            severity_order.get(p.severity, 3),  # Critical first
-            p.id  # Alphabetical as tiebreaker
-        ))
-        
-        return relevant
+        return frozenset(relevant_components)
     
     def _extract_timestamp(self, line: str) -> Optional[datetime]:
         """Extract timestamp from log line"""
-        patterns = [
-            r'(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2})',
-            r'"time":"([^"]+)"',
-            r'"timestamp":"([^"]+)"',
-            r'"@timestamp":"([^"]+)"',
-            r'\[(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[^\]]*)\]',
-        ]
-        
-        for pattern in patterns:
-            if match := re.search(pattern, line):
+        for regex in TIMESTAMP_EXTRACTORS:
+            if match := regex.search(line):
                 try:
                     timestamp_str = match.group(1).replace('T', ' ').split('.')[0].split('+')[0].split('Z')[0]
                     return datetime.fromisoformat(timestamp_str)
@@ -1093,20 +1619,38 @@ class TurboStreamProcessor:
 class EnhancedPatternBank:
     """Complete pattern bank with all GitLab error patterns"""
     
+    CACHE_VERSION = 5  # Bump when the automaton layout or Hyperscan flags change
+    
     def __init__(self):
         self.patterns: List[ErrorPattern] = []
         self.by_component: Dict[str, List[ErrorPattern]] = defaultdict(list)
         self.by_severity: Dict[str, List[ErrorPattern]] = defaultdict(list)
         self.compiled_patterns: Dict[str, re.Pattern] = {}
         self.automaton = None
+        self.hyperscan_db = None
+        self._digest: Optional[str] = None
         
         self._load_all_patterns()
+        self._build_attribute_tables()
         self._compile_patterns()
+        self._build_leading_tokens()
+        self._build_anchors()
+        self._build_unanchored_regex()
+        self._build_quick_filters()
+        self._build_required_words()
         if HAS_AHOCORASICK:
             self._build_automaton()
+        if USE_HYPERSCAN:
+            self._build_hyperscan_db()
     
     def _load_all_patterns(self):
-        """Load ALL GitLab error patterns - COMPLETE SET FROM YOUR ORIGINAL + ENHANCED"""
+        """Load ALL GitLab error patterns (built and compiled once per process)"""
+        self.patterns.extend(self._builtin_patterns())
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _builtin_patterns() -> Tuple[ErrorPattern, ...]:
+        """ALL GitLab error patterns - COMPLETE SET FROM YOUR ORIGINAL + ENHANCED"""
         
         # ==================== PRAEFECT/GITALY PATTERNS ====================
         praefect_patterns = [
@@ -1137,8 +1681,6 @@ class EnhancedPatternBank:
             ErrorPattern('pf_repl_fail', r'praefect.*replication.*failed(?!.*t\.)', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
             ErrorPattern('pf_primary_unreach', r'praefect.*primary.*unreachable', 'Praefect/Gitaly', 'infrastructure', 'CRITICAL'),
             ErrorPattern('pf_voting_fail', r'praefect.*voting.*failed', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
-            ErrorPattern('pf_metadata_inconsist', r'praefect.*metadata.*inconsistent', 'Praefect/Gitaly', 'infrastructure', 'WARNING'),
-            ErrorPattern('pf_failover', r'praefect.*failover.*triggered', 'Praefect/Gitaly', 'infrastructure', 'WARNING'),
             ErrorPattern('pf_reconcil_fail', r'praefect.*reconciliation.*failed', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
             ErrorPattern('pf_datastore_err', r'praefect.*datastore.*error(?!.*INFO)', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
             ErrorPattern('pf_node_mgr_err', r'praefect.*node.*manager.*error(?!.*INFO)', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
@@ -1158,16 +1700,12 @@ class EnhancedPatternBank:
             ErrorPattern('health_check_fail', r'health.*check.*failed(?!.*will\s+retry)', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
             
             # GRPC errors - Enhanced with more variations
-            ErrorPattern('grpc_unavail', r'(?:rpc\s+error|RPC\s+error|grpc).*code\s*=\s*Unavailable', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
-            ErrorPattern('grpc_deadline', r'(?:rpc\s+error|RPC\s+error|grpc).*code\s*=\s*DeadlineExceeded', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
-            ErrorPattern('grpc_internal', r'(?:rpc\s+error|RPC\s+error|grpc).*code\s*=\s*Internal', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
-            ErrorPattern('grpc_notfound', r'(?:rpc\s+error|RPC\s+error|grpc).*code\s*=\s*NotFound', 'Praefect/Gitaly', 'infrastructure', 'WARNING'),
+            ErrorPattern('grpc_unavail', r'(?:rpc\s+error|RPC\s+error|grpc).*code\s*=\s*Unavailable|GRPC::Unavailable', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
+            ErrorPattern('grpc_deadline', r'(?:rpc\s+error|RPC\s+error|grpc).*code\s*=\s*DeadlineExceeded|GRPC::DeadlineExceeded', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
+            ErrorPattern('grpc_internal', r'(?:rpc\s+error|RPC\s+error|grpc).*code\s*=\s*Internal|GRPC::Internal', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
+            ErrorPattern('grpc_notfound', r'(?:rpc\s+error|RPC\s+error|grpc).*code\s*=\s*NotFound|GRPC::NotFound', 'Praefect/Gitaly', 'infrastructure', 'WARNING'),
             ErrorPattern('grpc_error', r'(?:rpc\s+error|RPC\s+error).*desc\s*=', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
-            ErrorPattern('grpc_unavail2', r'GRPC::Unavailable', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
-            ErrorPattern('grpc_deadline2', r'GRPC::DeadlineExceeded', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
-            ErrorPattern('grpc_internal2', r'GRPC::Internal', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
             ErrorPattern('grpc_invalid', r'GRPC::InvalidArgument', 'Praefect/Gitaly', 'infrastructure', 'WARNING'),
-            ErrorPattern('grpc_notfound2', r'GRPC::NotFound', 'Praefect/Gitaly', 'infrastructure', 'WARNING'),
             ErrorPattern('grpc_exists', r'GRPC::AlreadyExists', 'Praefect/Gitaly', 'infrastructure', 'WARNING'),
             ErrorPattern('grpc_permission', r'GRPC::PermissionDenied', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
             ErrorPattern('grpc_exhausted', r'GRPC::ResourceExhausted', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
@@ -1278,10 +1816,8 @@ class EnhancedPatternBank:
             ErrorPattern('gitaly_hooks_slow', r'gitaly-hooks.*taking.*seconds.*to\s+start', 'Praefect/Gitaly', 'performance', 'WARNING'),
             
             # Additional error level indicators
-            ErrorPattern('pf_level_error', r'"level"\s*:\s*"error".*praefect(?!.*Worker)', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
-            ErrorPattern('gitaly_level_error', r'"level"\s*:\s*"error".*gitaly(?!.*Worker)', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
-            ErrorPattern('pf_level_error2', r'level=error.*praefect', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
-            ErrorPattern('gitaly_level_error2', r'level=error.*gitaly', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
+            ErrorPattern('pf_level_error', r'"level"\s*:\s*"error".*praefect(?!.*Worker)|level=error.*praefect', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
+            ErrorPattern('gitaly_level_error', r'"level"\s*:\s*"error".*gitaly(?!.*Worker)|level=error.*gitaly', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
             ErrorPattern('pf_error_log', r'ERROR:.*praefect', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
             ErrorPattern('gitaly_error_log', r'ERROR:.*gitaly', 'Praefect/Gitaly', 'infrastructure', 'ERROR'),
             ErrorPattern('pf_fatal_log', r'FATAL:.*praefect(?!.*shutdown)', 'Praefect/Gitaly', 'infrastructure', 'CRITICAL'),
@@ -1341,7 +1877,7 @@ class EnhancedPatternBank:
             ErrorPattern('pg_admin_termination', r'FATAL.*terminating\s+connection\s+due\s+to\s+administrator\s+command(?!.*gitlab-ctl)', 'PostgreSQL', 'database', 'WARNING'),
             ErrorPattern('pg_idle_timeout', r'FATAL.*terminating\s+connection\s+due\s+to\s+idle-in-transaction\s+timeout', 'PostgreSQL', 'database', 'WARNING'),
             ErrorPattern('pg_no_hba_entry', r'FATAL.*no\s+pg_hba\.conf\s+entry', 'PostgreSQL', 'database', 'ERROR'),
-            ErrorPattern('pg_too_many_clients', r'FATAL.*sorry.*too\s+many\s+clients\s+already', 'PostgreSQL', 'database', 'ERROR'),
+            ErrorPattern('pg_too_many_clients', r'(?:FATAL.*sorry|ERROR).*too\s+many\s+clients\s+already', 'PostgreSQL', 'database', 'ERROR'),
             ErrorPattern('pg_rel_not_exist', r'ERROR.*relation.*does\s+not\s+exist(?!.*creating)', 'PostgreSQL', 'database', 'ERROR'),
             ErrorPattern('pg_col_not_exist', r'ERROR.*column.*does\s+not\s+exist(?!.*adding)', 'PostgreSQL', 'database', 'ERROR'),
             ErrorPattern('pg_func_not_exist', r'ERROR.*function.*does\s+not\s+exist', 'PostgreSQL', 'database', 'ERROR'),
@@ -1351,7 +1887,6 @@ class EnhancedPatternBank:
             ErrorPattern('pg_conflict_recovery', r'ERROR.*canceling\s+statement\s+due\s+to\s+conflict\s+with\s+recovery', 'PostgreSQL', 'database', 'WARNING'),
             ErrorPattern('pg_shared_preload', r'ERROR.*shared_preload_libraries', 'PostgreSQL', 'database', 'ERROR'),
             ErrorPattern('pg_max_conn_exceeded', r'ERROR.*max_connections.*exceeded', 'PostgreSQL', 'database', 'ERROR'),
-            ErrorPattern('pg_too_many_clients2', r'ERROR.*too\s+many\s+clients\s+already', 'PostgreSQL', 'database', 'ERROR'),
             ErrorPattern('pg_db_not_accepting', r'ERROR.*database.*is\s+not\s+accepting\s+connections', 'PostgreSQL', 'database', 'ERROR'),
             ErrorPattern('pg_repl_slot_not_exist', r'replication\s+slot.*does\s+not\s+exist', 'PostgreSQL', 'database', 'ERROR'),
             ErrorPattern('pg_wal_ahead', r'requested\s+starting\s+point.*ahead\s+of.*WAL', 'PostgreSQL', 'database', 'ERROR'),
@@ -1437,10 +1972,8 @@ class EnhancedPatternBank:
             ErrorPattern('sidekiq_launcher_died', r'Sidekiq.*launcher.*died', 'Sidekiq', 'background_jobs', 'ERROR'),
             ErrorPattern('sidekiq_fetcher_died', r'Sidekiq.*fetcher.*died', 'Sidekiq', 'background_jobs', 'ERROR'),
             ErrorPattern('sidekiq_oom_killed', r'Sidekiq.*OOM.*killed', 'Sidekiq', 'background_jobs', 'CRITICAL'),
-            ErrorPattern('sidekiq_mem_limit', r'Sidekiq.*memory.*limit.*exceeded', 'Sidekiq', 'background_jobs', 'ERROR'),
             ErrorPattern('sidekiq_queue_latency', r'Sidekiq.*queue.*latency.*high', 'Sidekiq', 'background_jobs', 'WARNING'),
             ErrorPattern('sidekiq_worker_stuck', r'Sidekiq.*worker.*stuck', 'Sidekiq', 'background_jobs', 'ERROR'),
-            ErrorPattern('sidekiq_job_timeout_exceed', r'Sidekiq.*job.*timeout.*exceeded', 'Sidekiq', 'background_jobs', 'ERROR'),
             ErrorPattern('sidekiq_redis_pool_exhaust', r'Sidekiq.*Redis.*connection.*pool.*exhausted', 'Sidekiq', 'background_jobs', 'ERROR'),
             ErrorPattern('job_failed_times', r'Job.*failed.*times', 'Sidekiq', 'background_jobs', 'ERROR'),
             ErrorPattern('job_raised_exception', r'Job\s+raised\s+exception', 'Sidekiq', 'background_jobs', 'ERROR', multiline=True),
@@ -1568,7 +2101,6 @@ class EnhancedPatternBank:
             ErrorPattern('k8s_job_backoff', r'Job\s+failed:\s*BackoffLimitExceeded', 'Kubernetes/Helm', 'kubernetes', 'ERROR'),
             ErrorPattern('helm_no_deployed', r'UPGRADE\s+FAILED:.*has\s+no\s+deployed\s+releases', 'Kubernetes/Helm', 'kubernetes', 'ERROR'),
             ErrorPattern('helm_patch_fail', r'UPGRADE\s+FAILED:\s*cannot\s+patch.*with\s+kind\s+Deployment', 'Kubernetes/Helm', 'kubernetes', 'ERROR'),
-            ErrorPattern('helm_type_mismatch', r'UPGRADE\s+FAILED:\s*type\s+mismatch', 'Kubernetes/Helm', 'kubernetes', 'ERROR'),
             ErrorPattern('helm_args_err', r'Error:\s*this\s+command\s+needs\s+2\s+arguments', 'Kubernetes/Helm', 'kubernetes', 'ERROR'),
             ErrorPattern('helm_drop_view_err', r'Error:\s*cannot\s+drop\s+view.*because\s+extension.*requires\s+it', 'Kubernetes/Helm', 'kubernetes', 'ERROR'),
             ErrorPattern('k8s_image_pull_backoff', r'ImagePullBackOff', 'Kubernetes/Helm', 'kubernetes', 'ERROR'),
@@ -1714,7 +2246,6 @@ class EnhancedPatternBank:
             ErrorPattern('workhorse_terminal_timeout', r'terminal.*timeout', 'Workhorse', 'terminal', 'ERROR'),
             ErrorPattern('workhorse_websocket_dial_fail', r'websocket.*dial.*failed', 'Workhorse', 'websocket', 'ERROR'),
             ErrorPattern('workhorse_dependency_proxy_fail', r'dependency.*proxy.*failed', 'Workhorse', 'dependencyproxy', 'ERROR'),
-            ErrorPattern('workhorse_dependency_proxy_inject_fail', r'dependency.*proxy.*inject.*failed', 'Workhorse', 'dependencyproxy', 'ERROR'),
             ErrorPattern('workhorse_senddata_inject_fail', r'senddata.*inject.*failed', 'Workhorse', 'senddata', 'ERROR'),
             ErrorPattern('workhorse_senddata_header_missing', r'senddata.*header.*missing', 'Workhorse', 'senddata', 'WARNING'),
             ErrorPattern('workhorse_archive_cleaner_walk_fail', r'error\s+walking\s+archive\s+cleaner\s+path', 'Workhorse', 'archive', 'ERROR'),
@@ -1746,14 +2277,12 @@ class EnhancedPatternBank:
             ErrorPattern('workhorse_duo_workflow_client_fail', r'duo.*workflow.*client.*error', 'Workhorse', 'ai', 'ERROR'),
             ErrorPattern('workhorse_duo_workflow_action_fail', r'duo.*workflow.*action.*failed', 'Workhorse', 'ai', 'ERROR'),
             ErrorPattern('workhorse_sendfile_fail', r'sendfile.*failed', 'Workhorse', 'sendfile', 'ERROR'),
-            ErrorPattern('workhorse_sendfile_inject_fail', r'sendfile.*inject.*failed', 'Workhorse', 'sendfile', 'ERROR'),
             ErrorPattern('workhorse_forward_headers_fail', r'forward.*headers.*failed', 'Workhorse', 'proxy', 'ERROR'),
             ErrorPattern('workhorse_method_not_allowed', r'method.*not.*allowed', 'Workhorse', 'proxy', 'ERROR'),
             ErrorPattern('workhorse_transport_restricted', r'transport.*restricted', 'Workhorse', 'transport', 'ERROR'),
             ErrorPattern('workhorse_transport_allowed_ip_error', r'AllowedIPError', 'Workhorse', 'transport', 'ERROR'),
             ErrorPattern('workhorse_transport_cidr_parse_fail', r'error\s+parsing.*CIDR', 'Workhorse', 'transport', 'ERROR'),
             ErrorPattern('workhorse_listener_fail', r'listener.*failed', 'Workhorse', 'server', 'ERROR'),
-            ErrorPattern('workhorse_listener_tls_fail', r'listener.*TLS.*failed', 'Workhorse', 'server', 'ERROR'),
             ErrorPattern('workhorse_version_mismatch', r'version.*mismatch', 'Workhorse', 'version', 'WARNING'),
             ErrorPattern('workhorse_url_prefix_invalid', r'url.*prefix.*invalid', 'Workhorse', 'config', 'ERROR'),
             ErrorPattern('workhorse_gob_encode_fail', r'gob.*encode.*failed', 'Workhorse', 'encoding', 'ERROR'),
@@ -1764,7 +2293,6 @@ class EnhancedPatternBank:
             ErrorPattern('workhorse_export_fail', r'export.*failed', 'Workhorse', 'export', 'ERROR'),
             ErrorPattern('workhorse_group_import_fail', r'group.*import.*failed', 'Workhorse', 'import', 'ERROR'),
             ErrorPattern('workhorse_metric_image_upload_fail', r'metric.*image.*upload.*failed', 'Workhorse', 'upload', 'ERROR'),
-            ErrorPattern('workhorse_work_items_csv_import_fail', r'work_items.*import_csv.*failed', 'Workhorse', 'import', 'ERROR'),
             ErrorPattern('workhorse_wiki_attachment_fail', r'wiki.*attachment.*failed', 'Workhorse', 'upload', 'ERROR'),
             ErrorPattern('workhorse_correlation_id_missing', r'correlation.*id.*missing', 'Workhorse', 'logging', 'WARNING'),
             ErrorPattern('workhorse_helper_fail', r'helper.*failed', 'Workhorse', 'util', 'ERROR'),
@@ -1981,7 +2509,6 @@ class EnhancedPatternBank:
             ErrorPattern('k8s_node_pid_pressure', r'(?:node|Node).*(?:PIDPressure|pid\s+pressure)', 'Kubernetes/Helm', 'node', 'WARNING'),
             ErrorPattern('k8s_node_selector_mismatch', r'node\s+selector.*(?:mismatch|does\s+not\s+match)', 'Kubernetes/Helm', 'scheduler', 'ERROR'),
             ErrorPattern('k8s_operator_error', r'operator.*(?:error|failed|reconcile\s+error)', 'Kubernetes/Helm', 'operator', 'ERROR'),
-            ErrorPattern('k8s_operator_reconcile_error', r'operator.*reconcile.*(?:error|failed)', 'Kubernetes/Helm', 'operator', 'ERROR'),
             ErrorPattern('k8s_permission_denied', r'permission.*denied.*(?:pod|service|deployment)', 'Kubernetes/Helm', 'rbac', 'ERROR'),
             ErrorPattern('k8s_pv_failed', r'PersistentVolume.*Failed', 'Kubernetes/Helm', 'storage', 'ERROR'),
             ErrorPattern('k8s_pvc_lost', r'PersistentVolumeClaim.*Lost', 'Kubernetes/Helm', 'storage', 'CRITICAL'),
@@ -1992,7 +2519,6 @@ class EnhancedPatternBank:
             ErrorPattern('k8s_replicaset_quota', r'ReplicaSet.*(?:quota|exceeded)', 'Kubernetes/Helm', 'deployment', 'ERROR'),
             ErrorPattern('k8s_runner_container_error', r'gitlab-runner.*container.*(?:error|failed)', 'Kubernetes/Helm', 'runner', 'ERROR'),
             ErrorPattern('k8s_runner_executor_error', r'gitlab-runner.*executor.*(?:error|failed)', 'Kubernetes/Helm', 'runner', 'ERROR'),
-            ErrorPattern('k8s_runner_job_failed', r'gitlab-runner.*job.*(?:failed|error)', 'Kubernetes/Helm', 'runner', 'ERROR'),
             ErrorPattern('k8s_runner_pod_creation_failed', r'gitlab-runner.*pod.*(?:creation|create).*failed', 'Kubernetes/Helm', 'runner', 'ERROR'),
             ErrorPattern('k8s_scheduling_failed', r'[Ff]ailed\s+to\s+schedule\s+pod', 'Kubernetes/Helm', 'scheduler', 'ERROR'),
             ErrorPattern('k8s_secret_not_found', r'(?:kubernetes|kubectl|pod|container).*secret.*not.*found', 'Kubernetes/Helm', 'rbac', 'ERROR'),
@@ -2015,7 +2541,6 @@ class EnhancedPatternBank:
             ErrorPattern('k8s_vpa_error', r'VerticalPodAutoscaler.*(?:error|failed)', 'Kubernetes/Helm', 'vpa', 'ERROR'),
             ErrorPattern('k8s_weave_error', r'weave.*(?:error|failed)', 'Kubernetes/Helm', 'cni', 'ERROR'),
             ErrorPattern('k8s_workspace_error', r'workspace.*(?:error|failed)', 'Kubernetes/Helm', 'workspace', 'ERROR'),
-            ErrorPattern('k8s_workspace_pod_failed', r'workspace.*pod.*(?:failed|error)', 'Kubernetes/Helm', 'workspace', 'ERROR'),
             ErrorPattern('k8s_workspace_timeout', r'workspace.*(?:timeout|deadline)', 'Kubernetes/Helm', 'workspace', 'ERROR'),
             
             # Additional Helm patterns  
@@ -2029,10 +2554,8 @@ class EnhancedPatternBank:
             ErrorPattern('helm_release_not_found', r'(?:helm\s+)?release\s+.*not\s+found', 'Kubernetes/Helm', 'helm', 'ERROR'),
             ErrorPattern('helm_release_timeout', r'Error:\s+release\s+\w+\s+failed:\s+timed\s+out', 'Kubernetes/Helm', 'helm', 'ERROR'),
             ErrorPattern('helm_resource_conflict', r'helm.*resource.*conflict', 'Kubernetes/Helm', 'helm', 'ERROR'),
-            ErrorPattern('helm_rollback_failed', r'ROLLBACK\s+FAILED', 'Kubernetes/Helm', 'helm', 'ERROR'),
             ErrorPattern('helm_template_error', r'helm.*template.*(?:error|failed)', 'Kubernetes/Helm', 'helm', 'ERROR'),
             ErrorPattern('helm_timeout', r'helm.*(?:timeout|timed.*out)', 'Kubernetes/Helm', 'helm', 'ERROR'),
-            ErrorPattern('helm_upgrade_failed', r'UPGRADE\s+FAILED', 'Kubernetes/Helm', 'helm', 'ERROR'),
             ErrorPattern('helm_values_error', r'helm.*values.*(?:error|invalid)', 'Kubernetes/Helm', 'helm', 'ERROR'),
         ]
         
@@ -2043,60 +2566,324 @@ class EnhancedPatternBank:
             ssl_patterns + geo_patterns + other_patterns + additional_patterns
         )
         
-        self.patterns.extend(all_patterns)
-        
+        return tuple(all_patterns)
+    
+    def _build_attribute_tables(self):
+        """Build Struct-of-Arrays tables (one uint8 array per attribute) for fast aggregation"""
+        self.pattern_index: Dict[str, int] = {p.id: i for i, p in enumerate(self.patterns)}
+        self.attribute_names: Dict[str, List[str]] = {}
+        self.attribute_ids: Dict[str, array] = {}
+        
+        for attr in ('component', 'category'):
+            names = sorted({getattr(p, attr) for p in self.patterns})
+            lookup = {name: i for i, name in enumerate(names)}
+            self.attribute_names[attr] = names
+            self.attribute_ids[attr] = array('B', (lookup[getattr(p, attr)] for p in self.patterns))
+        
+        # Severity ids are the Severity ranks themselves
+        self.attribute_names['severity'] = [s.name for s in Severity]
+        self.attribute_ids['severity'] = array('B', (p.severity_rank for p in self.patterns))
+        
+        # Scan order sorted once, so a per-file selection is just a mask over it
+        self.scan_order = array('H', sorted(
+            range(len(self.patterns)),
+            key=lambda i: (
+                -self.patterns[i].priority,  # Higher priority first
+                -self.patterns[i].severity_rank,  # Critical first
+                self.patterns[i].id  # Alphabetical as tiebreaker
+            )
+        ))
+        self._selection_cache: Dict[frozenset, List[ErrorPattern]] = {}
+    
+    def patterns_for(self, components: Set[str]) -> List[ErrorPattern]:
+        """Patterns of the given components plus every CRITICAL pattern, in scan order"""
+        key = frozenset(components)
+        if key in self._selection_cache:
+            return self._selection_cache[key]
+        
+        wanted = [i for i, name in enumerate(self.attribute_names['component']) if name in key]
+        component_ids = self.attribute_ids['component']
+        severity_ids = self.attribute_ids['severity']
+        
+        if HAS_NUMPY:
+            order = np.frombuffer(self.scan_order, dtype=np.uint16)
+            mask = (np.isin(np.frombuffer(component_ids, dtype=np.uint8), wanted) |
+                    (np.frombuffer(severity_ids, dtype=np.uint8) >= Severity.CRITICAL))
+            selected = order[mask[order]].tolist()
+        else:
+            wanted_ids = set(wanted)
+            selected = [i for i in self.scan_order
+                        if component_ids[i] in wanted_ids or severity_ids[i] >= Severity.CRITICAL]
+        
+        # A regex identical to one earlier in the scan order can never win a line
+        selection, seen = [], set()
+        for i in selected:
+            source = self.patterns[i].pattern
+            if source not in seen:
+                seen.add(source)
+                selection.append(self.patterns[i])
+        
+        self._selection_cache[key] = selection
+        return selection
+    
+    def count_by(self, attr: str, pattern_counts: Dict[str, int]) -> Dict[str, int]:
+        """Count hits per attribute value (component/category/severity) from per-pattern hit counts"""
+        names = self.attribute_names[attr]
+        table = self.attribute_ids[attr]
+        counts = [0] * len(names)
+        for pid, count in pattern_counts.items():
+            if pid in self.pattern_index:
+                counts[table[self.pattern_index[pid]]] += count
+        
+        return {name: count for name, count in zip(names, counts) if count}
+    
     def _compile_patterns(self):
-        """Compile patterns with caching"""
+        """Index the regexes each ErrorPattern compiled at construction"""
         for pattern in self.patterns:
-            try:
-                self.compiled_patterns[pattern.id] = re2.compile(
-                    pattern.pattern, 
-                    re2.IGNORECASE | re2.MULTILINE
-                )
-            except Exception as e:
-                print(f"Failed to compile pattern {pattern.id}: {e}")
+            if pattern.compiled is not None:
+                self.compiled_patterns[pattern.id] = pattern.compiled
+    
+    def _build_leading_tokens(self):
+        """Map patterns that open with a severity token (FATAL/PANIC/ERROR/...) to that token"""
+        self.leading_tokens: Dict[str, str] = {}
+        
+        for pattern in self.patterns:
+            match = LEADING_WORD_RE.match(pattern.pattern)
+            if not match:
+                continue
+            
+            word, alt1, alt2 = match.group('word'), match.group('alt1'), match.group('alt2')
+            if alt1 and alt1.lower() == alt2.lower():
+                word = alt1  # (?:ERROR|error) style case alternation
+            
+            token = (word or '').lower()
+            if token in SEVERITY_PREFIXES:
+                self.leading_tokens[pattern.id] = token
+    
+    def _pattern_digest(self) -> str:
+        """Hash of the pattern set, used to invalidate cached artifacts"""
+        if self._digest is None:
+            digest = hashlib.sha256(f"v{self.CACHE_VERSION}".encode())
+            for pattern in self.patterns:
+                digest.update(f"{pattern.id}\0{pattern.pattern}\0".encode())
+            self._digest = digest.hexdigest()[:16]
+        return self._digest
+    
+    def _cache_file(self, name: str, suffix: str) -> Path:
+        return CACHE_DIR / f"{name}_{self._pattern_digest()}{suffix}"
+    
+    def _load_cached(self, name: str, suffix: str, loads) -> Any:
+        """Load an artifact built by a previous run for the same pattern set (None on a miss)"""
+        return _load_cache_file(self._cache_file(name, suffix), name, loads)
+    
+    def _store_cached(self, name: str, suffix: str, data: bytes):
+        """Cache an artifact for the next run with the same pattern set"""
+        _store_cache_file(self._cache_file(name, suffix), name, data)
     
     def _build_automaton(self):
         """Build Aho-Corasick automaton for ultra-fast multi-pattern matching"""
         if not HAS_AHOCORASICK:
             return
-        self.automaton = pyahocorasick.Automaton()
         
-        for pattern in self.patterns:
-            # Extract literal strings from regex
-            literals = self._extract_literals(pattern.pattern)
-            for literal in literals:
-                self.automaton.add_word(literal.lower(), pattern)
+        self.automaton = self._load_cached('automaton', '.pkl', pickle.loads)
+        if self.automaton is not None:
+            return
+        
+        # One automaton serves both the quick pre-check (any hit) and candidate
+        # routing: each word maps to the ids of the patterns it anchors
+        anchored: Dict[str, Set[str]] = defaultdict(set)
+        for pattern_id, anchors in self.anchors.items():
+            for anchor in anchors:
+                anchored[anchor].add(pattern_id)
+        
+        self.automaton = pyahocorasick.Automaton()
+        words = set(self.quick_filters)
+        for required in self.required_words.values():
+            words.update(required)
+        for word in words:
+            self.automaton.add_word(word, (word, tuple(sorted(anchored.get(word, ())))))
         
         self.automaton.make_automaton()
         print(f"✅ Built Aho-Corasick automaton with {len(self.automaton)} patterns")
+        self._store_cached('automaton', '.pkl', pickle.dumps(self.automaton, protocol=pickle.HIGHEST_PROTOCOL))
     
-    def _extract_literals(self, regex_pattern: str) -> List[str]:
-        """Extract literal strings from regex for Aho-Corasick"""
-        literals = []
+    def _build_hyperscan_db(self):
+        """Compile every pattern into one Hyperscan database (SIMD multi-pattern prefilter)"""
+        self.hyperscan_ids: List[str] = [pattern.id for pattern in self.patterns if pattern.id in self.compiled_patterns]
+        
+        # Compiling takes several seconds, so reuse the database from a previous run
+        self.hyperscan_db = self._load_cached('hyperscan', '.db', _load_hyperscan_db)
+        if self.hyperscan_db is not None:
+            return
+        
+        # See HYPERSCAN_PREFILTER_FLAGS: the per-pattern regexes confirm every candidate
+        pattern_map = {pattern.id: pattern for pattern in self.patterns}
+        expressions = [pattern_map[pattern_id].pattern.encode() for pattern_id in self.hyperscan_ids]
         
-        # Remove regex special chars to get literals
-        cleaned = re.sub(r'[\\^$*+?{}\[\]().|]', ' ', regex_pattern)
-        words = cleaned.split()
+        try:
+            database = _compile_hyperscan_db(expressions)
+        except Exception as e:
+            print(f"⚠️  Hyperscan rejected the pattern set, using the regular matcher: {e}")
+            return
+        
+        self.hyperscan_db = database
+        print(f"✅ Built Hyperscan database with {len(expressions)} patterns")
+        self._store_cached('hyperscan', '.db', hyperscan.dumpb(database))
+    
+    def _build_anchors(self):
+        """Index each pattern's trigger words - the literal anchors the automaton routes on"""
+        # Parsing ~800 regexes for their literals is a third of a cold start
+        self.literal_runs: Dict[str, List[List[str]]] = self._load_cached('literals', '.pkl', pickle.loads)
+        if self.literal_runs is None:
+            self.literal_runs = {pattern.id: extract_literal_runs(pattern.pattern) for pattern in self.patterns}
+            self._store_cached('literals', '.pkl', pickle.dumps(self.literal_runs, protocol=pickle.HIGHEST_PROTOCOL))
+        # ~2500 literals are only ~950 distinct words ("failed", "error", ...);
+        # interning makes every table built from them share one object per word
+        self.literal_runs = {
+            pattern_id: [[sys.intern(run) for run in alternative_runs] for alternative_runs in runs]
+            for pattern_id, runs in self.literal_runs.items()
+        }
+        for pattern in self.patterns:
+            object.__setattr__(pattern, 'trigger_words', trigger_words_from_runs(self.literal_runs.get(pattern.id, [])))
         
-        # FIXED: Extract both lowercase and original case
-        # Filter meaningful words (>3 chars)
-        for w in words:
-            if len(w) > 3:
-                literals.append(w.lower())  # Add lowercase version
+        self.anchors: Dict[str, Tuple[str, ...]] = {
+            pattern.id: tuple(sorted(pattern.trigger_words))
+            for pattern in self.patterns
+            if pattern.trigger_words
+        }
         
-        return literals if literals else [regex_pattern[:20].lower()]
+        # A component whose every pattern is anchored can be ruled out as a whole
+        # when none of its trigger words is on the line
+        component_words: Dict[str, Set[str]] = defaultdict(set)
+        unanchored_components = set()
+        for pattern in self.patterns:
+            if pattern.trigger_words:
+                component_words[pattern.component].update(pattern.trigger_words)
+            else:
+                unanchored_components.add(pattern.component)
+        self.component_words: Dict[str, frozenset] = {
+            component: frozenset(words)
+            for component, words in component_words.items()
+            if component not in unanchored_components
+        }
+    
+    def _build_unanchored_regex(self):
+        """Fuse the patterns that have no literal anchor into one named-group alternation"""
+        # These run on every line that passes the pre-check, so one C-level search
+        # replaces a Python-level loop over them. Anchored patterns stay separate:
+        # fusing all ~800 is slower than the automaton-routed loop.
+        self.unanchored_regex = None
+        self.unanchored_ids = frozenset(pattern.id for pattern in self.patterns
+                                        if pattern.id in self.compiled_patterns and pattern.id not in self.anchors)
+        branches = [f"(?P<{pattern.id}>{pattern.pattern})" for pattern in self.patterns
+                    if pattern.id in self.unanchored_ids]
+        if not branches:
+            return
+        try:
+            self.unanchored_regex = re2.compile('|'.join(branches), re2.IGNORECASE)
+        except Exception as e:
+            print(f"⚠️  Could not fuse unanchored patterns, scanning them one by one: {e}")
+    
+    def _build_quick_filters(self):
+        """Build the pre-check words: a line holding none of them cannot match any pattern"""
+        # A line can only match an anchored pattern through one of its trigger
+        # words. Splitting every regex source into [a-z]+ runs used to add words
+        # from lookaheads and generic indicators ("info", "will", "user", ...)
+        # that let nearly every line through to the false-positive filter.
+        filters = set()
+        for anchors in self.anchors.values():
+            filters.update(anchors)
+        # Patterns without a literal anchor keep the coarse split of their source
+        for pattern in self.patterns:
+            if pattern.id not in self.anchors:
+                simple_strings = re.findall(r'[a-z]+', pattern.pattern.lower())
+                filters.update(s for s in simple_strings if len(s) > 3)
+        self.quick_filters: Set[str] = filters
+        
+        # Without the automaton the pre-check is one search over the lowercased
+        # line rather than an `in` test per word (RE2 runs it in linear time)
+        alternation = '|'.join(re.escape(word) for word in sorted(filters))
+        if HAS_GOOGLE_RE2:
+            options = google_re2.Options()
+            options.log_errors = False
+            self.quick_filter_search = google_re2.compile(alternation, options).search
+        else:
+            self.quick_filter_search = re.compile(alternation).search
+    
+    def _build_required_words(self):
+        """Automaton words, besides the anchor, that a single-alternative pattern also needs"""
+        # Patterns sharing an anchor (dozens start with "workhorse" or "praefect")
+        # are told apart by their other literals once per line, rather than each
+        # running its regex. The automaton reports these words too, but only the
+        # quick filters let a line past the pre-check.
+        self.required_words: Dict[str, frozenset] = {}
+        for pattern_id in self.anchors:
+            runs = self.literal_runs.get(pattern_id, [])
+            if len(runs) != 1:
+                continue
+            words = frozenset(run for run in runs[0] if len(run) >= MIN_TRIGGER_LENGTH)
+            if len(words) > 1:
+                self.required_words[pattern_id] = words
+
+
+# Pattern bank used by pool workers - set in the parent before forking so
+# children inherit it, built by the pool initializer otherwise (spawn start method)
+_WORKER_BANK: Optional[EnhancedPatternBank] = None
+
+# Stream processor reused for every task a pool worker runs (it keeps no per-file state)
+_WORKER_PROCESSOR: Optional['TurboStreamProcessor'] = None
+
+
+class _CollectingQueue:
+    """Queue stand-in that buffers results inside a worker process"""
+    
+    def __init__(self):
+        self.items: List[Dict[str, Any]] = []
+    
+    async def put(self, item: Dict[str, Any]):
+        self.items.append(item)
+
+
+def _init_scan_worker():
+    """Pool initializer: set up the pattern bank and stream processor once per worker process"""
+    global _WORKER_BANK, _WORKER_PROCESSOR
+    if _WORKER_BANK is None:
+        _WORKER_BANK = EnhancedPatternBank()
+    _WORKER_PROCESSOR = TurboStreamProcessor(_WORKER_BANK)
+
+
+def _scan_file_worker(file_path: str, byte_range: Optional[Tuple[int, int]] = None) -> Tuple[int, List[Dict[str, Any]]]:
+    """Scan a single file (or a byte range of one) inside a pool worker and return its queued results"""
+    if _WORKER_PROCESSOR is None:
+        _init_scan_worker()
+    
+    queue = _CollectingQueue()
+    errors_found = asyncio.run(_WORKER_PROCESSOR.process_file_streaming(Path(file_path), queue, byte_range))
+    return errors_found, queue.items
+
+
+def _scan_batch_worker(tasks: List[Tuple[str, Optional[Tuple[int, int]]]]) -> Tuple[int, List[Dict[str, Any]]]:
+    """Scan a batch of files (or byte ranges) inside a pool worker and return all their queued results"""
+    errors_found = 0
+    items = []
+    for file_path, byte_range in tasks:
+        file_errors, file_items = _scan_file_worker(file_path, byte_range)
+        errors_found += file_errors
+        items.extend(file_items)
+    return errors_found, items
 
 
 class TurboAutoGrep:
     """Main analyzer with streaming and parallel processing"""
     
-    # CONSTANTS
-    MAX_CONCURRENT_FILES = 32  # Limit concurrent file processing
+    SPLIT_RANGE_BYTES = 32 * 1024 * 1024  # Per-task slice of a huge file
+    BATCH_BYTES = 1024 * 1024  # Small files are handed to workers in batches of about this size
+    SAMPLES_PER_GROUP = 3  # Full errors kept per signature group in the report
     
     def __init__(self, workers: int = None):
         self.workers = workers or min(mp.cpu_count(), 32)  # Increased from 16 to 32
         self.pattern_bank = EnhancedPatternBank()
+        self.false_positive_filter = FalsePositiveFilter()
         self.results_queue = None
         self.stats = {
             'files_processed': 0,
@@ -2123,9 +2910,9 @@ class TurboAutoGrep:
             print(f"📋 Found {len(files)} files to analyze")
             
             # Start result collector
-            results = []
+            error_groups = {}
             collector_task = asyncio.create_task(
-                self._collect_results(self.results_queue, results, callback)
+                self._collect_results(self.results_queue, error_groups, callback)
             )
             
             # Process files in parallel
@@ -2140,115 +2927,171 @@ class TurboAutoGrep:
             
             self.stats['end_time'] = time.time()
             
-            # Group and analyze results
-            analyzed_results = self._analyze_results(results)
+            # Build the report from the groups
+            analyzed_results = self._analyze_results(error_groups)
             
             return analyzed_results
     
     async def _process_files_parallel_async(self, files: List[Path]):
-        """Process files in parallel with async/await - WITH CONCURRENCY LIMIT"""
-        
-        # CRITICAL FIX: Add semaphore to prevent task explosion
-        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FILES)
+        """Process files in parallel across CPU cores with a process pool"""
+        global _WORKER_BANK
         
-        # Create processor pool
-        processors = [
-            TurboStreamProcessor(self.pattern_bank) 
-            for _ in range(self.workers)
-        ]
+        # Forked workers inherit the compiled pattern bank copy-on-write
+        _WORKER_BANK = self.pattern_bank
         
-        # Process with concurrency limit
-        async def process_with_limit(file_path: Path, processor_idx: int):
-            async with semaphore:
-                processor = processors[processor_idx % self.workers]
-                return await processor.process_file_streaming(file_path, self.results_queue)
-        
-        # Create tasks with limit
-        tasks = [
-            process_with_limit(file_path, i) 
-            for i, file_path in enumerate(files)
-        ]
+        loop = asyncio.get_running_loop()
         
-        # Run all tasks concurrently (but limited by semaphore)
-        results = await asyncio.gather(*tasks)
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_scan_worker) as executor:
+            futures = [
+                loop.run_in_executor(executor, _scan_batch_worker,
+                                     [(str(file_path), byte_range) for file_path, byte_range in batch])
+                for batch in self._plan_scan_tasks(files)
+            ]
+            
+            # Stream each batch's results to the collector as soon as it finishes
+            for future in asyncio.as_completed(futures):
+                try:
+                    _, items = await future
+                except Exception as e:
+                    print(f"Worker error: {e}")
+                    continue
+                
+                await self.results_queue.put({'type': 'batch', 'items': items})
         
+        # errors_found is counted by the collector as it drains the queue
         self.stats['files_processed'] = len(files)
-        self.stats['errors_found'] = sum(results)
     
-    async def _collect_results(self, queue: AsyncQueue, results: List, callback):
-        """Collect streaming results"""
-        while True:
+    def _plan_scan_tasks(self, files: List[Path]) -> List[List[Tuple[Path, Optional[Tuple[int, int]]]]]:
+        """Batches of scan tasks - one task per file, except huge plain files, which get one per byte range"""
+        tasks = []
+        sizes = []
+        for file_path in files:
             try:
-                item = await queue.get()
-                
-                if item['type'] == 'complete':
-                    break
-                elif item['type'] == 'error':
-                    results.append(item['data'])
-                    self.stats['errors_found'] += 1
-                    
-                    # Stream to callback if provided
-                    if callback:
-                        result = callback(item['data'])
-                        if result and asyncio.iscoroutine(result):
-                            await result
-                        
-                elif item['type'] == 'progress':
-                    # Handle progress updates
-                    if callback:
-                        result = callback({'type': 'progress', **item})
-                        if result and asyncio.iscoroutine(result):
-                            await result
+                file_size = file_path.stat().st_size
+            except OSError:
+                file_size = 0
+            
+            # Huge files already take the mmap path, which needs no per-file state
+            # beyond a few lines of context, so its ranges can run on separate cores
+            if (self.workers > 1 and file_size > TurboStreamProcessor.MMAP_THRESHOLD_BYTES
+                    and not str(file_path).endswith('.gz')):
+                for start in range(0, file_size, self.SPLIT_RANGE_BYTES):
+                    end = min(start + self.SPLIT_RANGE_BYTES, file_size)
+                    tasks.append((file_path, (start, end)))
+                    sizes.append(end - start)
+            else:
+                tasks.append((file_path, None))
+                sizes.append(file_size)
+        
+        # An SOS bundle holds hundreds of small logs, and a pool round-trip per
+        # file costs more than scanning one, so small tasks travel together.
+        # Batches stay small enough for every worker to get several.
+        batch_bytes = min(self.BATCH_BYTES, sum(sizes) // (self.workers * 4) or 1)
+        batches = []
+        batch = []
+        batch_size = 0
+        for task, size in zip(tasks, sizes):
+            batch.append(task)
+            batch_size += size
+            if batch_size >= batch_bytes:
+                batches.append(batch)
+                batch = []
+                batch_size = 0
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    async def _collect_results(self, queue: AsyncQueue, error_groups: Dict[str, Dict[str, Any]], callback):
+        """Collect streaming results into their signature groups"""
+        while True:
+            batch = await queue.get()
+            if batch['type'] == 'complete':
+                break
+            
+            # Workers hand back all results of a task batch as one queue item
+            items = batch['items'] if batch['type'] == 'batch' else (batch,)
+            for item in items:
+                try:
+                    if item['type'] == 'error':
+                        self._add_to_group(error_groups, item['data'])
+                        self.stats['errors_found'] += 1
                         
-            except Exception as e:
-                print(f"Collector error: {e}")
+                        # Stream to callback if provided
+                        if callback:
+                            result = callback(item['data'])
+                            if result and asyncio.iscoroutine(result):
+                                await result
+                            
+                    elif item['type'] == 'progress':
+                        # Handle progress updates
+                        if callback:
+                            result = callback({'type': 'progress', **item})
+                            if result and asyncio.iscoroutine(result):
+                                await result
+                            
+                except Exception as e:
+                    print(f"Collector error: {e}")
     
-    def _analyze_results(self, results: List[Dict]) -> Dict[str, Any]:
-        """Analyze and group results"""
+    def _add_to_group(self, error_groups: Dict[str, Dict[str, Any]], error: Dict):
+        """Fold one error into its signature group (count, first samples, files, flags)"""
+        # Groups are built as errors stream in, so only SAMPLES_PER_GROUP errors
+        # per signature are kept rather than every error of a noisy log
+        sig = self._create_signature(error)
+        group = error_groups.get(sig)
+        if group is None:
+            group = error_groups[sig] = {
+                'signature': sig,
+                'count': 0,
+                'message': error['message'],  # Clean message
+                'severity': error['severity'],
+                'component': error['component'],
+                'pattern_id': error['pattern_id'],
+                'samples': [],
+                'files': set(),
+                'has_correlation': False,
+                'has_stack_trace': False
+            }
         
-        print(f"🔍 Analyzing {len(results)} error results...")
+        group['count'] += 1
+        if len(group['samples']) < self.SAMPLES_PER_GROUP:
+            group['samples'].append(error)
+        group['files'].add(error['file_path'])
+        group['has_correlation'] = group['has_correlation'] or bool(error.get('correlation_id'))
+        group['has_stack_trace'] = group['has_stack_trace'] or bool(error.get('stack_trace'))
+    
+    def _analyze_results(self, error_groups: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Analyze grouped results"""
         
-        # DEBUG: Print first result to see structure
-        if results:
-            print(f"📋 First result keys: {list(results[0].keys())}")
-            print(f"📋 First result sample: {results[0].get('message', 'NO MESSAGE')[:100]}")
+        # One pass over the groups: every group holds a single pattern, so the
+        # per-pattern counts come from them, and their file sets become lists
+        pattern_counts = Counter()
+        for group in error_groups.values():
+            pattern_counts[group['pattern_id']] += group['count']
+            group['files'] = list(group['files'])
+        total_errors = sum(pattern_counts.values())
         
-        # Group by signature
-        error_groups = defaultdict(list)
+        print(f"🔍 Analyzing {total_errors} error results...")
         
-        for error in results:
-            # Create signature for grouping
-            sig = self._create_signature(error)
-            error_groups[sig].append(error)
+        # DEBUG: Print first result to see structure
+        if error_groups:
+            first = next(iter(error_groups.values()))['samples'][0]
+            print(f"📋 First result keys: {list(first.keys())}")
+            print(f"📋 First result sample: {first.get('message', 'NO MESSAGE')[:100]}")
         
-        print(f"📊 Created {len(error_groups)} error groups from {len(results)} errors")
+        print(f"📊 Created {len(error_groups)} error groups from {total_errors} errors")
         
         # Build final report
         report = {
             'summary': self.stats,
-            'total_errors': len(results),
+            'total_errors': total_errors,
             'unique_patterns': len(error_groups),
-            'errors_by_severity': self._group_by_severity(results),
-            'errors_by_component': self._group_by_component(results),
+            'errors_by_severity': self._group_by_severity(pattern_counts),
+            'errors_by_component': self._group_by_component(pattern_counts),
             'error_groups': [],
             'top_errors': []
         }
         
-        # Process error groups
-        for sig, errors in error_groups.items():
-            group = {
-                'signature': sig,
-                'count': len(errors),
-                'message': errors[0]['message'],  # Clean message
-                'severity': errors[0]['severity'],
-                'component': errors[0]['component'],
-                'pattern_id': errors[0]['pattern_id'],
-                'samples': errors[:3],  # Keep first 3 full samples
-                'files': list(set(e['file_path'] for e in errors)),
-                'has_correlation': any(e.get('correlation_id') for e in errors),
-                'has_stack_trace': any(e.get('stack_trace') for e in errors)
-            }
-            report['error_groups'].append(group)
+        report['error_groups'].extend(error_groups.values())
         
         print(f"✅ Built {len(report['error_groups'])} error groups")
         
@@ -2263,50 +3106,48 @@ class TurboAutoGrep:
     def _create_signature(self, error: Dict) -> str:
         """Create signature for grouping similar errors"""
         # Use pattern_id + normalized message
-        message = error.get('message', '')
-        
-        # Normalize message
-        normalized = re.sub(r'\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}', 'TIMESTAMP', message)
-        normalized = re.sub(r'[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}', 'UUID', normalized)
-        normalized = re.sub(r'\b\d+\b', 'N', normalized)
+        # Normalize message - the same message often repeats thousands of times
+        normalized = _normalize_message(error.get('message', ''))
         
         return f"{error['pattern_id']}:{normalized[:100]}"
     
-    def _group_by_severity(self, results: List[Dict]) -> Dict[str, int]:
+    def _group_by_severity(self, pattern_counts: Dict[str, int]) -> Dict[str, int]:
         """Group errors by severity"""
-        severity_counts = defaultdict(int)
-        for error in results:
-            severity_counts[error['severity']] += 1
-        return dict(severity_counts)
+        return self.pattern_bank.count_by('severity', pattern_counts)
     
-    def _group_by_component(self, results: List[Dict]) -> Dict[str, int]:
+    def _group_by_component(self, pattern_counts: Dict[str, int]) -> Dict[str, int]:
         """Group errors by component"""
-        component_counts = defaultdict(int)
-        for error in results:
-            component_counts[error['component']] += 1
-        return dict(component_counts)
+        return self.pattern_bank.count_by('component', pattern_counts)
     
     def _extract_tar(self, tar_path: str, dest: str) -> List[Path]:
         """Extract tar and return file paths - WITH SECURITY VALIDATION"""
         files = []
         
-        # Determine compression mode
+        # Determine compression mode - stream modes ('r|...') decompress the archive
+        # once, front to back, extracting each member as it is reached; reading the
+        # member index first (getmembers) would decompress everything twice
         if tar_path.endswith('.tar.gz') or tar_path.endswith('.tgz'):
-            mode = 'r:gz'
+            mode = 'r|gz'
         elif tar_path.endswith('.tar.bz2') or tar_path.endswith('.tbz2'):
-            mode = 'r:bz2'
+            mode = 'r|bz2'
         elif tar_path.endswith('.tar.xz'):
-            mode = 'r:xz'
+            mode = 'r|xz'
         else:
-            mode = 'r'
+            mode = 'r|*'
+        
+        # tarfile only knows stdlib gzip; hand it the ISA-L stream as a plain tar
+        fileobj = None
+        if mode == 'r|gz' and HAS_ISAL:
+            fileobj, mode = gzip_open(tar_path, 'rb'), 'r|'
         
         try:
-            with tarfile.open(tar_path, mode) as tar:
+            with tarfile.open(tar_path, mode, fileobj=fileobj) as tar:
                 # CRITICAL SECURITY FIX: Validate paths to prevent traversal attacks
                 extracted_count = 0
                 skipped_count = 0
+                unscanned_count = 0
                 
-                for member in tar.getmembers():
+                for member in tar:
                     # Check for path traversal attempts
                     if member.name.startswith('/') or '..' in member.name:
                         print(f"⚠️  Skipping dangerous path: {member.name}")
@@ -2319,6 +3160,11 @@ class TurboAutoGrep:
                         skipped_count += 1
                         continue
                     
+                    # Files the workers would skip by name are never written to disk
+                    if member.isfile() and self.false_positive_filter.is_skipped_file(Path(dest) / member.name):
+                        unscanned_count += 1
+                        continue
+                    
                     # Extract safely
                     try:
                         tar.extract(member, dest)
@@ -2329,7 +3175,8 @@ class TurboAutoGrep:
                         continue
                 
                 print(f"✅ Extracted {extracted_count} files" + 
-                      (f" (skipped {skipped_count})" if skipped_count > 0 else ""))
+                      (f" (skipped {skipped_count})" if skipped_count > 0 else "") +
+                      (f", left {unscanned_count} config/schema/system files in the archive" if unscanned_count > 0 else ""))
                 
                 # Now collect extracted files
                 for root, _, filenames in os.walk(dest):
@@ -2345,6 +3192,9 @@ class TurboAutoGrep:
         except Exception as e:
             print(f"❌ Unexpected error extracting {tar_path}: {e}")
             raise
+        finally:
+            if fileobj is not None:
+                fileobj.close()
         
         return files
 
@@ -2355,13 +3205,22 @@ AutoGrep = TurboAutoGrep
 
 def main():
     """CLI entry point for testing"""
-    import sys
     if len(sys.argv) < 2:
         print("Usage: python autogrep.py <tar_file>")
         sys.exit(1)
     
     tar_file = sys.argv[1]
     
+    # One stat() both checks the path and rules out directories / empty files
+    try:
+        st = os.stat(tar_file)
+    except FileNotFoundError:
+        print(f"❌ File not found: {tar_file}")
+        sys.exit(1)
+    if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+        print(f"❌ Not a regular, non-empty file: {tar_file}")
+        sys.exit(1)
+    
     async def run_analysis():
         analyzer = TurboAutoGrep()
         
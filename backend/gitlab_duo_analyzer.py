@@ -47,8 +47,10 @@ class GitLabDuoRESTAnalyzer:
     def _save_session(self, session_id: str, data: Dict):
         """Save session data to disk"""
         file_path = self.storage_dir / f"{session_id}.json"
+        # Serialize first, then write once - json.dump issues a write per token.
+        # Compact: these files are only read back by _load_session
         with open(file_path, 'w') as f:
-            json.dump(data, f, default=str, indent=2)
+            f.write(json.dumps(data, default=str, separators=(',', ':')))
     
     def _load_session(self, session_id: str) -> Optional[Dict]:
         """Load session from disk"""
@@ -44,6 +44,12 @@ import multiprocessing as mp
 import pickle
 import aiofiles
 import uuid
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 from asyncio import create_task, Queue
 
 from upload import router as upload_router
@@ -270,15 +276,34 @@ class AnalysisStateManager:
     async def save_state(session_id: str, state: dict):
         """Save analysis state to disk"""
         state_file = ANALYSIS_STATE_DIR / f"{session_id}.json"
-        async with aiofiles.open(state_file, 'w') as f:
-            await f.write(json.dumps(state, default=str))
+        if HAS_ORJSON:
+            # The final state carries the whole AutoGrep report; orjson encodes it
+            # to UTF-8 in one call. Datetimes, dataclasses and int keys are left to
+            # default=str / key coercion so the file reads back as with json.dumps
+            payload = orjson.dumps(
+                state,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+        else:
+            payload = json.dumps(state, default=str).encode('utf-8')
+        # Write beside the target and rename over it: status polls and websocket
+        # connects read this file while the final report is being written
+        tmp_file = state_file.with_name(f"{state_file.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            async with aiofiles.open(tmp_file, 'wb') as f:
+                await f.write(payload)
+            os.replace(tmp_file, state_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
     
     @staticmethod
     async def load_state(session_id: str) -> Optional[dict]:
         """Load analysis state from disk"""
         state_file = ANALYSIS_STATE_DIR / f"{session_id}.json"
         if state_file.exists():
-            async with aiofiles.open(state_file, 'r') as f:
+            async with aiofiles.open(state_file, 'r', encoding='utf-8') as f:
                 content = await f.read()
                 return json.loads(content)
         return None
@@ -413,12 +438,31 @@ class SystemMetricsParser:
         # Broad search if needed
         if len(available) < 3:
             print(f"⚠ Limited commands found, searching broadly...")
-            for cmd in commands:
-                if cmd not in available:
-                    matches = list(self.session_dir.rglob(f"{cmd}*"))
-                    if matches:
-                        available[cmd] = matches[0]
-                        print(f"  Found {cmd} at: {matches[0]}")
+            # One scandir walk for all missing commands instead of an rglob per
+            # command. Entries are visited in rglob order (a directory's entries,
+            # then its subdirectories depth-first), so each command still maps to
+            # the first name starting with it
+            missing = [cmd for cmd in commands if cmd not in available]
+            found = {}
+            pending = [self.session_dir]
+            while pending and len(found) < len(missing):
+                try:
+                    with os.scandir(pending.pop()) as it:
+                        entries = list(it)
+                except OSError:
+                    continue
+                for entry in entries:
+                    for cmd in missing:
+                        if cmd not in found and entry.name.startswith(cmd):
+                            found[cmd] = Path(entry.path)
+                pending.extend(reversed([
+                    entry.path for entry in entries
+                    if entry.is_dir() and not entry.is_symlink()
+                ]))
+            for cmd in missing:
+                if cmd in found:
+                    available[cmd] = found[cmd]
+                    print(f"  Found {cmd} at: {found[cmd]}")
         
         print(f"✅ Discovered {len(available)} command outputs")
         return available
@@ -2628,8 +2672,10 @@ async def extract_and_index_file(session_id: str, file_path: Path):
 async def create_custom_session():
     """Create a new custom session for individual file uploads"""
     
+    # Second-resolution timestamps collide when two sessions are created in the
+    # same second (they would share a directory), so add a random suffix
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    session_id = f"custom_{timestamp}"
+    session_id = f"custom_{timestamp}_{uuid.uuid4().hex[:8]}"
     
     session_dir = Path("data/extracted") / session_id
     session_dir.mkdir(parents=True, exist_ok=True)
@@ -2821,11 +2867,18 @@ async def _add_individual_file_to_session(
     if target_path.exists():
         name_parts = filename.rsplit('.', 1)
         timestamp = datetime.now().strftime('%H%M%S')
-        if len(name_parts) > 1:
-            filename = f"{name_parts[0]}_{timestamp}.{name_parts[1]}"
-        else:
-            filename = f"{filename}_{timestamp}"
-        target_path = added_dir / filename
+        # The same name added twice within a second gets a counter too,
+        # instead of overwriting the first renamed copy
+        suffix = timestamp
+        counter = 1
+        while target_path.exists():
+            if len(name_parts) > 1:
+                filename = f"{name_parts[0]}_{suffix}.{name_parts[1]}"
+            else:
+                filename = f"{original_filename}_{suffix}"
+            target_path = added_dir / filename
+            counter += 1
+            suffix = f"{timestamp}_{counter}"
     
     # Write file
     with open(target_path, 'wb') as f:
@@ -3908,11 +3961,20 @@ async def list_sessions():
         if extracted_dir.exists():
             for session_dir in extracted_dir.iterdir():
                 if session_dir.is_dir():
-                    # Calculate size
-                    size = sum(f.stat().st_size for f in session_dir.rglob("*") if f.is_file())
-                    
-                    # Get file count
-                    file_count = len(list(session_dir.rglob("*")))
+                    # Calculate size and entry count in one scandir walk - DirEntry
+                    # answers is_dir/is_file from the directory listing, so each
+                    # file is stat()ed once (rglob twice over did it twice)
+                    size = 0
+                    file_count = 0
+                    pending = [session_dir]
+                    while pending:
+                        with os.scandir(pending.pop()) as entries:
+                            for entry in entries:
+                                file_count += 1
+                                if entry.is_dir(follow_symlinks=False):
+                                    pending.append(entry.path)
+                                elif entry.is_file():
+                                    size += entry.stat().st_size
                     
                     # Get modification time
                     mtime = session_dir.stat().st_mtime